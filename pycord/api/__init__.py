@@ -6,11 +6,19 @@ Implementation of the Discord API.
 :copyright: 2021-present Pycord Development
 :license: MIT
 """
+import asyncio
 import logging
 import sys
 from typing import Any, Sequence
 
-from aiohttp import BasicAuth, ClientSession, FormData, __version__ as aiohttp_version
+from aiohttp import (
+    BasicAuth,
+    ClientError,
+    ClientSession,
+    FormData,
+    TCPConnector,
+    __version__ as aiohttp_version,
+)
 
 from pycord._about import __version__
 
@@ -28,6 +36,9 @@ __all__: Sequence[str] = ('Route', 'BaseRoute', 'HTTPClient')
 
 _log = logging.getLogger(__name__)
 
+DEFAULT_BUCKET_CONCURRENCY: int = 50
+MAX_INFLIGHT_REQUESTS: int = 50
+
 
 class HTTPClient(
     ApplicationCommands,
@@ -63,9 +74,25 @@ class HTTPClient(
 
         self._session: None | ClientSession = None
         self._executers: list[Executer] = []
+        # concurrency buckets keyed by the unformatted route template, so
+        # bursts on one endpoint never stall requests to unrelated ones
+        self._buckets: dict[str, asyncio.Semaphore] = {}
+        self._bucket_limits: dict[str, int] = {}
+        # overall in-flight cap: backpressure for callers looping over
+        # thousands of requests instead of letting a 429 storm build up
+        self._inflight = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
 
     async def create_session(self) -> None:
-        self._session = ClientSession()
+        # one large keep-alive pool; aiohttp already sets TCP_NODELAY on
+        # every connection, so bursts reuse warm connections without
+        # per-request handshakes
+        self._session = ClientSession(
+            connector=TCPConnector(
+                limit=256,
+                limit_per_host=256,
+                ttl_dns_cache=300,
+            )
+        )
 
     async def close_session(self) -> None:
         await self._session.close()
@@ -120,55 +147,91 @@ class HTTPClient(
                 _log.debug(f'Pausing request to {endpoint}: Found rate limit executer')
                 await executer.wait()
 
-        for try_ in range(5):
-            if files:
-                for file in files:
-                    file.reset(try_)
-
-            if form:
-                data = FormData(quote_fields=False)
-                for params in form:
-                    data.add_field(**params)
-
-            r = await self._session.request(
-                method,
-                endpoint,
-                data=data,
-                headers=headers,
-                proxy=self._proxy,
-                proxy_auth=self._proxy_auth,
-                params=query_params,
+        bucket = self._buckets.get(route.path)
+        if bucket is None:
+            bucket = self._buckets[route.path] = asyncio.Semaphore(
+                self._bucket_limits.get(route.path, DEFAULT_BUCKET_CONCURRENCY)
             )
-            _log.debug(f'Received back {await r.text()}')
-
-            data = await utils._text_or_json(cr=r)
 
-            if r.status == 429:
-                _log.debug(f'Request to {endpoint} failed: Request returned rate limit')
-                executer = Executer(route=route)
-
-                self._executers.append(executer)
-                await executer.executed(
-                    reset_after=data['retry_after'],
-                    is_global=r.headers.get('X-RateLimit-Scope') == 'global',
-                    limit=int(r.headers.get('X-RateLimit-Limit', 10)),
-                )
-                self._executers.remove(executer)
-                continue
-
-            elif r.status == 403:
-                raise Forbidden(resp=r, data=data)
-            elif r.status == 404:
-                raise NotFound(resp=r, data=data)
-            elif r.status == 500:
-                raise InternalError(resp=r, data=data)
-            elif r.ok:
-                return data
-            else:
-                if self.verbose:
-                    raise BotException(r, data)
+        async with self._inflight, bucket:
+            for try_ in range(5):
+                if files:
+                    for file in files:
+                        file.reset(try_)
+
+                if form:
+                    data = FormData(quote_fields=False)
+                    for params in form:
+                        data.add_field(**params)
+
+                try:
+                    r = await self._session.request(
+                        method,
+                        endpoint,
+                        data=data,
+                        headers=headers,
+                        proxy=self._proxy,
+                        proxy_auth=self._proxy_auth,
+                        params=query_params,
+                    )
+                except (ClientError, OSError):
+                    if try_ == 4:
+                        raise
+
+                    _log.debug(
+                        f'Request to {endpoint} failed with a network error, retrying'
+                    )
+                    await asyncio.sleep(min(2 ** try_, 30))
+                    continue
+                _log.debug(f'Received back {await r.text()}')
+
+                limit_header = r.headers.get('X-RateLimit-Limit')
+                if limit_header and route.path not in self._bucket_limits:
+                    self._bucket_limits[route.path] = limit = int(limit_header)
+                    if limit < DEFAULT_BUCKET_CONCURRENCY:
+                        # right-size the bucket; in-flight holders drain
+                        # through the old semaphore
+                        self._buckets[route.path] = asyncio.Semaphore(limit)
+
+                # keep the serialized request body in data; retried
+                # attempts resend it, so the response must not clobber it
+                resp_data = await utils._text_or_json(cr=r)
+
+                if r.status == 429:
+                    _log.debug(
+                        f'Request to {endpoint} failed: Request returned rate limit'
+                    )
+                    executer = Executer(route=route)
+
+                    self._executers.append(executer)
+                    await executer.executed(
+                        reset_after=resp_data['retry_after'],
+                        is_global=r.headers.get('X-RateLimit-Scope') == 'global',
+                        limit=int(r.headers.get('X-RateLimit-Limit', 10)),
+                    )
+                    self._executers.remove(executer)
+                    continue
+
+                elif r.status == 403:
+                    raise Forbidden(resp=r, data=resp_data)
+                elif r.status == 404:
+                    raise NotFound(resp=r, data=resp_data)
+                elif r.status in (500, 502, 503, 504):
+                    if try_ == 4:
+                        raise InternalError(resp=r, data=resp_data)
+
+                    _log.debug(
+                        f'Request to {endpoint} failed with {r.status}, retrying'
+                    )
+                    await asyncio.sleep(min(2 ** try_, 30))
+                    continue
+                elif r.ok:
+                    return resp_data
                 else:
-                    raise HTTPException(resp=r, data=data)
+                    if self.verbose:
+                        raise BotException(r, resp_data)
+                    else:
+                        raise HTTPException(resp=r, data=resp_data)
 
     async def get_gateway_bot(self) -> dict[str, Any]:
         return await self.request('GET', Route('/gateway/bot'))
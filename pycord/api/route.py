@@ -18,12 +18,30 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE
-from typing import Sequence
+import re
+from functools import lru_cache
+from typing import Callable, Sequence
 
 from pycord.types import Snowflake
 
 __all__: Sequence[str] = ('Route', 'BaseRoute')
 
+_FIELD_PATTERN = re.compile(r'\{(\w+)\}')
+
+
+@lru_cache(maxsize=None)
+def _compile_formatter(
+    path: str,
+) -> tuple[Callable[..., str] | None, tuple[str, ...]]:
+    # specialize each template into a plain f-string lambda once; this
+    # replaces str.format's parsing state machine on every construction
+    fields = tuple(_FIELD_PATTERN.findall(path))
+
+    if not fields:
+        return None, fields
+
+    return eval('lambda {}: f{!r}'.format(', '.join(fields), path)), fields
+
 
 class BaseRoute:
     guild_id: int | None
@@ -66,14 +84,26 @@ class Route(BaseRoute):
 
         self.parameters = parameters
 
+        formatter, fields = _compile_formatter(path)
+
+        if formatter is None:
+            self._formatted_path = path
+        else:
+            majors = {
+                'guild_id': guild_id,
+                'channel_id': channel_id,
+                'webhook_id': webhook_id,
+                'webhook_token': webhook_token,
+            }
+            self._formatted_path = formatter(
+                *[
+                    parameters[field] if field in parameters else majors[field]
+                    for field in fields
+                ]
+            )
+
     def merge(self, url: str):
-        return url + self.path.format(
-            guild_id=self.guild_id,
-            channel_id=self.channel_id,
-            webhook_id=self.webhook_id,
-            webhook_token=self.webhook_token,
-            **self.parameters,
-        )
+        return url + self._formatted_path
 
     def __eq__(self, route: 'Route') -> bool:
         return (
@@ -236,7 +236,7 @@ class ApplicationCommands(BaseRouter):
     async def bulk_overwrite_global_commands(
         self, application_id: Snowflake, application_commands: list[ApplicationCommand]
     ) -> list[ApplicationCommand]:
-        await self.request(
+        return await self.request(
             'PUT',
             Route(
                 '/applications/{application_id}/commands', application_id=application_id
@@ -250,7 +250,7 @@ class ApplicationCommands(BaseRouter):
         guild_id: Snowflake,
         application_commands: list[ApplicationCommand],
     ) -> list[ApplicationCommand]:
-        await self.request(
+        return await self.request(
             'PUT',
             Route(
                 '/applications/{application_id}/guilds/{guild_id}/commands',
@@ -18,12 +18,84 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE
+import asyncio
+
 from ...snowflake import Snowflake
 from ...types import ApplicationRoleConnectionMetadata
 from ..route import Route
 from .base import BaseRouter
 
 
+class MetadataBatcher:
+    """Coalesces metadata record updates for one application into one PUT.
+
+    The endpoint replaces the full record list, so only the most recently
+    queued list needs to be sent; every waiter within the window receives
+    the response of that single request.
+    """
+
+    MAX_BATCH: int = 100
+    MAX_WAIT: float = 0.025
+
+    def __init__(self, router: BaseRouter, application_id: Snowflake) -> None:
+        self._router = router
+        self._route = Route(
+            '/applications/{application_id}/role-connections/metadata',
+            application_id=application_id,
+        )
+        self._queue: asyncio.Queue[
+            tuple[list[ApplicationRoleConnectionMetadata], asyncio.Future]
+        ] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+
+    def push(self, records: list[ApplicationRoleConnectionMetadata]) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((records, future))
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+
+        return future
+
+    async def _drain(self) -> None:
+        while not self._queue.empty():
+            records, waiters = await self._collect()
+
+            try:
+                data = await self._router.request('PUT', self._route, records)
+            except Exception as exc:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(exc)
+            else:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(data)
+
+    async def _collect(
+        self,
+    ) -> tuple[list[ApplicationRoleConnectionMetadata], list[asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        records, future = await self._queue.get()
+        waiters = [future]
+        deadline = loop.time() + self.MAX_WAIT
+
+        while len(waiters) < self.MAX_BATCH:
+            timeout = deadline - loop.time()
+
+            if timeout <= 0:
+                break
+
+            try:
+                records, future = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+
+            waiters.append(future)
+
+        return records, waiters
+
+
 class ApplicationRoleConnections(BaseRouter):
     async def get_application_role_connection_metadata_records(
         self,
@@ -42,11 +114,15 @@ class ApplicationRoleConnections(BaseRouter):
         application_id: Snowflake,
         records: list[ApplicationRoleConnectionMetadata],
     ) -> list[ApplicationRoleConnectionMetadata]:
-        return self.request(
-            'PUT',
-            Route(
-                '/applications/{application_id}/role-connections/metadata',
-                application_id=application_id,
-            ),
-            records,
-        )
+        batchers: dict[Snowflake, MetadataBatcher]
+        batchers = getattr(self, '_metadata_batchers', None)
+
+        if batchers is None:
+            batchers = self._metadata_batchers = {}
+
+        batcher = batchers.get(application_id)
+
+        if batcher is None:
+            batcher = batchers[application_id] = MetadataBatcher(self, application_id)
+
+        return await batcher.push(records)
@@ -88,7 +88,7 @@ class AutoModeration(BaseRouter):
                 '/guilds/{guild_id}/auto-moderation/rules',
                 guild_id=guild_id,
             ),
-            remove_undefined(**data),
+            remove_undefined(data),
             reason=reason,
         )
 
@@ -122,7 +122,7 @@ class AutoModeration(BaseRouter):
                 guild_id=guild_id,
                 rule_id=rule_id,
             ),
-            remove_undefined(**data),
+            remove_undefined(data),
             reason=reason,
         )
 
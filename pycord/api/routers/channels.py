@@ -18,6 +18,10 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE
+import asyncio
+from functools import lru_cache
+from typing import AsyncIterator
+
 from ...missing import MISSING, MissingEnum
 from ...snowflake import Snowflake
 from ...types import (
@@ -38,13 +42,27 @@ from ..route import Route
 from .base import BaseRouter
 
 
+@lru_cache(maxsize=256)
+def _perm_str(value: int | None) -> str | None:
+    # permission bitmasks take few distinct values in practice, so the
+    # int-to-decimal conversion is worth memoizing for bulk syncs
+    return str(value) if value is not None else None
+
+
+@lru_cache(maxsize=4096)
+def _route(path: str, **parameters: str | int) -> Route:
+    # Routes are immutable once built, so the same (path, ids) pair can
+    # reuse one object instead of re-formatting the URL on every request.
+    return Route(path, **parameters)
+
+
 class Channels(BaseRouter):
     async def get_channel(
         self,
         channel_id: Snowflake,
     ) -> Channel:
         return await self.request(
-            'GET', Route('/channels/{channel_id}', channel_id=channel_id)
+            'GET', _route('/channels/{channel_id}', channel_id=channel_id)
         )
 
     async def modify_channel(
@@ -84,35 +102,42 @@ class Channels(BaseRouter):
         reason: str | None = None,
     ) -> Channel:
         data = {
-            'name': name,
-            'archived': archived,
-            'auto_archive_duration': auto_archive_duration,
-            'locked': locked,
-            'invitable': invitable,
-            'applied_tags': applied_tags,
-            'rate_limit_per_user': rate_limit_per_user,
-            'flags': flags,
-            'type': type,
-            'position': position,
-            'topic': topic,
-            'nsfw': nsfw,
-            'bitrate': bitrate,
-            'user_limit': user_imit,
-            'permission_overwrites': permission_overwrites,
-            'parent_id': parent_id,
-            'rtc_region': rtc_region,
-            'video_quality_mode': video_quality_mode,
-            'default_auto_archive_duration': default_auto_archive_duration,
-            'available_tags': available_tags,
-            'default_reaction_emoji': default_reaction_emoji,
-            'default_thread_rate_limit_per_user': default_thread_rate_limit_per_user,
-            'default_sort_order': default_sort_order,
-            'default_forum_layout': default_forum_layout,
+            k: v
+            for k, v in (
+                ('name', name),
+                ('archived', archived),
+                ('auto_archive_duration', auto_archive_duration),
+                ('locked', locked),
+                ('invitable', invitable),
+                ('applied_tags', applied_tags),
+                ('rate_limit_per_user', rate_limit_per_user),
+                ('flags', flags),
+                ('type', type),
+                ('position', position),
+                ('topic', topic),
+                ('nsfw', nsfw),
+                ('bitrate', bitrate),
+                ('user_limit', user_imit),
+                ('permission_overwrites', permission_overwrites),
+                ('parent_id', parent_id),
+                ('rtc_region', rtc_region),
+                ('video_quality_mode', video_quality_mode),
+                ('default_auto_archive_duration', default_auto_archive_duration),
+                ('available_tags', available_tags),
+                ('default_reaction_emoji', default_reaction_emoji),
+                (
+                    'default_thread_rate_limit_per_user',
+                    default_thread_rate_limit_per_user,
+                ),
+                ('default_sort_order', default_sort_order),
+                ('default_forum_layout', default_forum_layout),
+            )
+            if v is not MISSING
         }
         return await self.request(
             'PATCH',
-            Route('/channels/{channel_id}', channel_id=channel_id),
-            remove_undefined(**data),
+            _route('/channels/{channel_id}', channel_id=channel_id),
+            data,
             reason=reason,
         )
 
@@ -124,7 +149,7 @@ class Channels(BaseRouter):
     ) -> None:
         await self.request(
             'DELETE',
-            Route('/channels/{channel_id}', channel_id=channel_id),
+            _route('/channels/{channel_id}', channel_id=channel_id),
             reason=reason,
         )
 
@@ -139,18 +164,22 @@ class Channels(BaseRouter):
         reason: str | None = None,
     ) -> None:
         data = {
-            'allow': str(allow),
-            'deny': str(deny),
-            'type': type,
+            k: v
+            for k, v in (
+                ('allow', _perm_str(allow) if allow is not MISSING else MISSING),
+                ('deny', _perm_str(deny) if deny is not MISSING else MISSING),
+                ('type', type),
+            )
+            if v is not MISSING
         }
         await self.request(
             'PUT',
-            Route(
+            _route(
                 '/channels/{channel_id}/permissions/{overwrite_id}',
                 channel_id=channel_id,
                 overwrite_id=overwrite_id,
             ),
-            remove_undefined(**data),
+            data,
             reason=reason,
         )
 
@@ -159,7 +188,7 @@ class Channels(BaseRouter):
         channel_id: Snowflake,
     ) -> list[Invite]:
         return await self.request(
-            'GET', Route('/channels/{channel_id}/invites', channel_id=channel_id)
+            'GET', _route('/channels/{channel_id}/invites', channel_id=channel_id)
         )
 
     async def create_channel_invite(
@@ -176,18 +205,22 @@ class Channels(BaseRouter):
         reason: str | None = None,
     ) -> Invite:
         data = {
-            'max_age': max_age,
-            'max_uses': max_uses,
-            'temporary': temporary,
-            'unique': unique,
-            'target_type': target_type,
-            'target_user_id': target_user_id,
-            'target_application_id': target_application_id,
+            k: v
+            for k, v in (
+                ('max_age', max_age),
+                ('max_uses', max_uses),
+                ('temporary', temporary),
+                ('unique', unique),
+                ('target_type', target_type),
+                ('target_user_id', target_user_id),
+                ('target_application_id', target_application_id),
+            )
+            if v is not MISSING
         }
         return await self.request(
             'POST',
-            Route('/channels/{channel_id}/invites', channel_id=channel_id),
-            remove_undefined(**data),
+            _route('/channels/{channel_id}/invites', channel_id=channel_id),
+            data,
             reason=reason,
         )
 
@@ -200,7 +233,7 @@ class Channels(BaseRouter):
     ) -> None:
         await self.request(
             'DELETE',
-            Route(
+            _route(
                 '/channels/{channel_id}/permissions/{overwrite_id}',
                 channel_id=channel_id,
                 overwrite_id=overwrite_id,
@@ -219,7 +252,7 @@ class Channels(BaseRouter):
         }
         return await self.request(
             'POST',
-            Route(
+            _route(
                 '/channels/{channel_id}/followers',
                 channel_id=channel_id,
             ),
@@ -231,7 +264,7 @@ class Channels(BaseRouter):
         channel_id: Snowflake,
     ) -> None:
         await self.request(
-            'POST', Route('/channels/{channel_id}/typing', channel_id=channel_id)
+            'POST', _route('/channels/{channel_id}/typing', channel_id=channel_id)
         )
 
     async def get_pinned_messages(
@@ -239,7 +272,7 @@ class Channels(BaseRouter):
         channel_id: Snowflake,
     ) -> list[Message]:
         return await self.request(
-            'GET', Route('/channels/{channel_id}/pins', channel_id=channel_id)
+            'GET', _route('/channels/{channel_id}/pins', channel_id=channel_id)
         )
 
     async def group_dm_add_recipient(
@@ -256,7 +289,7 @@ class Channels(BaseRouter):
         }
         await self.request(
             'PUT',
-            Route(
+            _route(
                 '/channels/{channel_id}/recipients/{user_id}',
                 channel_id=channel_id,
                 user_id=user_id,
@@ -271,7 +304,7 @@ class Channels(BaseRouter):
     ) -> None:
         await self.request(
             'DELETE',
-            Route(
+            _route(
                 '/channels/{channel_id}/recipients/{user_id}',
                 channel_id=channel_id,
                 user_id=user_id,
@@ -289,18 +322,22 @@ class Channels(BaseRouter):
         reason: str | None = None,
     ) -> Channel:
         data = {
-            'name': name,
-            'auto_archive_duration': auto_archive_duration,
-            'rate_limit_per_user': rate_limit_per_user,
+            k: v
+            for k, v in (
+                ('name', name),
+                ('auto_archive_duration', auto_archive_duration),
+                ('rate_limit_per_user', rate_limit_per_user),
+            )
+            if v is not MISSING
         }
         return await self.request(
             'POST',
-            Route(
+            _route(
                 '/channels/{channel_id}/messages/{message_id}/threads',
                 channel_id=channel_id,
                 message_id=message_id,
             ),
-            remove_undefined(**data),
+            data,
             reason=reason,
         )
 
@@ -316,19 +353,23 @@ class Channels(BaseRouter):
         reason: str | None = None,
     ) -> Channel:
         data = {
-            'name': name,
-            'auto_archive_duration': auto_archive_duration,
-            'type': type,
-            'invitable': invitable,
-            'rate_limit_per_user': rate_limit_per_user,
+            k: v
+            for k, v in (
+                ('name', name),
+                ('auto_archive_duration', auto_archive_duration),
+                ('type', type),
+                ('invitable', invitable),
+                ('rate_limit_per_user', rate_limit_per_user),
+            )
+            if v is not MISSING
         }
         return await self.request(
             'POST',
-            Route(
+            _route(
                 '/channels/{channel_id}/threads',
                 channel_id=channel_id,
             ),
-            remove_undefined(**data),
+            data,
             reason=reason,
         )
 
@@ -344,17 +385,23 @@ class Channels(BaseRouter):
         reason: str | None = None,
     ) -> Channel:
         data = {
-            'name': name,
-            'auto_archive_duration': auto_archive_duration,
-            'rate_limit_per_user': rate_limit_per_user,
+            k: v
+            for k, v in (
+                ('name', name),
+                ('auto_archive_duration', auto_archive_duration),
+                ('rate_limit_per_user', rate_limit_per_user),
+                ('message', message),
+                ('applied_tags', applied_tags),
+            )
+            if v is not MISSING
         }
         return await self.request(
             'POST',
-            Route(
+            _route(
                 '/channels/{channel_id}/threads',
                 channel_id=channel_id,
             ),
-            remove_undefined(**data),
+            data,
             reason=reason,
         )
 
@@ -364,7 +411,7 @@ class Channels(BaseRouter):
     ) -> None:
         await self.request(
             'PUT',
-            Route(
+            _route(
                 '/channels/{channel_id}/thread-members/@me',
                 channel_id=channel_id,
             ),
@@ -377,7 +424,7 @@ class Channels(BaseRouter):
     ) -> None:
         await self.request(
             'PUT',
-            Route(
+            _route(
                 '/channels/{channel_id}/thread-members/{user_id}',
                 channel_id=channel_id,
                 user_id=user_id,
@@ -390,7 +437,7 @@ class Channels(BaseRouter):
     ) -> None:
         await self.request(
             'DELETE',
-            Route(
+            _route(
                 '/channels/{channel_id}/thread-members/@me',
                 channel_id=channel_id,
             ),
@@ -403,7 +450,7 @@ class Channels(BaseRouter):
     ) -> None:
         await self.request(
             'DELETE',
-            Route(
+            _route(
                 '/channels/{channel_id}/thread-members/{user_id}',
                 channel_id=channel_id,
                 user_id=user_id,
@@ -422,7 +469,7 @@ class Channels(BaseRouter):
         }
         return await self.request(
             'GET',
-            Route(
+            _route(
                 '/channels/{channel_id}/thread-members/{user_id}',
                 channel_id=channel_id,
                 user_id=user_id,
@@ -445,13 +492,101 @@ class Channels(BaseRouter):
         }
         return await self.request(
             'GET',
-            Route(
+            _route(
                 '/channels/{channel_id}/thread-members',
                 channel_id=channel_id,
             ),
             params=remove_undefined(params),
         )
 
+    async def iter_thread_members(
+        self,
+        channel_id: Snowflake,
+        *,
+        with_member: bool | MissingEnum = MISSING,
+        limit: int = 100,
+    ) -> AsyncIterator[ThreadMember]:
+        """Iterates every member of a thread, paging transparently.
+
+        The next page is prefetched while the current one is consumed, so
+        the round trip overlaps with caller-side processing.
+        """
+        task: asyncio.Task | None = None
+
+        try:
+            members = await self.list_thread_members(
+                channel_id,
+                with_member=with_member,
+                limit=limit,
+            )
+
+            while True:
+                task = None
+
+                if len(members) == limit:
+                    task = asyncio.create_task(
+                        self.list_thread_members(
+                            channel_id,
+                            with_member=with_member,
+                            after=members[-1]['user_id'],
+                            limit=limit,
+                        )
+                    )
+
+                for member in members:
+                    yield member
+
+                if task is None:
+                    return
+
+                members = await task
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def iter_public_archived_threads(
+        self,
+        channel_id: Snowflake,
+        *,
+        limit: int = 100,
+    ) -> AsyncIterator[Channel]:
+        """Iterates every public archived thread, paging transparently.
+
+        The next page is prefetched while the current one is consumed, so
+        the round trip overlaps with caller-side processing.
+        """
+        task: asyncio.Task | None = None
+
+        try:
+            data = await self.list_public_archived_threads(
+                channel_id,
+                limit=limit,
+            )
+
+            while True:
+                task = None
+                threads = data['threads']
+
+                if threads and data['has_more']:
+                    task = asyncio.create_task(
+                        self.list_public_archived_threads(
+                            channel_id,
+                            before=threads[-1]['thread_metadata']['archive_timestamp'],
+                            limit=limit,
+                        )
+                    )
+
+                for thread in threads:
+                    yield thread
+
+                if task is None:
+                    return
+
+                data = await task
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
+
     async def list_public_archived_threads(
         self,
         channel_id: Snowflake,
@@ -465,7 +600,7 @@ class Channels(BaseRouter):
         }
         return await self.request(
             'GET',
-            Route(
+            _route(
                 '/channels/{channel_id}/threads/archived/public',
                 channel_id=channel_id,
             ),
@@ -485,7 +620,7 @@ class Channels(BaseRouter):
         }
         return await self.request(
             'GET',
-            Route(
+            _route(
                 '/channels/{channel_id}/threads/archived/private',
                 channel_id=channel_id,
             ),
@@ -505,7 +640,7 @@ class Channels(BaseRouter):
         }
         return await self.request(
             'GET',
-            Route(
+            _route(
                 '/channels/{channel_id}/users/@me/threads/archived/private',
                 channel_id=channel_id,
             ),
@@ -59,7 +59,7 @@ class Emojis(BaseRouter):
         return await self.request(
             'POST',
             Route('POST', '/guilds/{guild_id}/emojis', guild_id=guild_id),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
@@ -83,7 +83,7 @@ class Emojis(BaseRouter):
                 guild_id=guild_id,
                 emoji_id=emoji_id,
             ),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
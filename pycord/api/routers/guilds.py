@@ -84,7 +84,7 @@ class Guilds(BaseRouter):
         if payload.get('icon'):
             payload['icon'] = to_datauri(payload['icon'])
 
-        return await self.request('POST', Route('/guilds'), remove_undefined(**payload))
+        return await self.request('POST', Route('/guilds'), remove_undefined(payload))
 
     async def get_guild(
         self, guild_id: Snowflake, *, with_counts: bool | MissingEnum = MISSING
@@ -93,7 +93,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'GET',
             Route('/guilds/{guild_id}', guild_id=guild_id),
-            query_params=remove_undefined(**params),
+            query_params=remove_undefined(params),
         )
 
     async def get_guild_preview(self, guild_id: Snowflake) -> GuildPreview:
@@ -160,7 +160,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'PATCH',
             Route('/guilds/{guild_id}', guild_id=guild_id),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
@@ -215,7 +215,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'POST',
             Route('/guilds/{guild_id}/channels', guild_id=guild_id),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
@@ -259,7 +259,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'GET',
             Route('/guilds/{guild_id}/members', guild_id=guild_id),
-            query_params=remove_undefined(**params),
+            query_params=remove_undefined(params),
         )
 
     async def search_guild_members(
@@ -276,7 +276,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'GET',
             Route('/guilds/{guild_id}/members/search', guild_id=guild_id),
-            query_params=remove_undefined(**params),
+            query_params=remove_undefined(params),
         )
 
     async def add_guild_member(
@@ -304,7 +304,7 @@ class Guilds(BaseRouter):
                 guild_id=guild_id,
                 user_id=user_id,
             ),
-            remove_undefined(**payload),
+            remove_undefined(payload),
         )
 
     async def modify_guild_member(
@@ -339,7 +339,7 @@ class Guilds(BaseRouter):
                 guild_id=guild_id,
                 user_id=user_id,
             ),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
@@ -356,7 +356,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'PATCH',
             Route('/guilds/{guild_id}/members/@me', guild_id=guild_id),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
@@ -431,7 +431,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'GET',
             Route('/guilds/{guild_id}/bans', guild_id=guild_id),
-            query_params=remove_undefined(**params),
+            query_params=remove_undefined(params),
         )
 
     async def get_guild_ban(self, guild_id: Snowflake, user_id: Snowflake) -> Ban:
@@ -458,7 +458,7 @@ class Guilds(BaseRouter):
             Route(
                 '/guilds/{guild_id}/bans/{user_id}', guild_id=guild_id, user_id=user_id
             ),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
@@ -507,7 +507,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'POST',
             Route('/guilds/{guild_id}/roles', guild_id=guild_id),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
@@ -552,7 +552,7 @@ class Guilds(BaseRouter):
             Route(
                 '/guilds/{guild_id}/roles/{role_id}', guild_id=guild_id, role_id=role_id
             ),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
@@ -603,7 +603,7 @@ class Guilds(BaseRouter):
         response = await self.request(
             'GET',
             Route('/guilds/{guild_id}/prune', guild_id=guild_id),
-            query_params=remove_undefined(**params),
+            query_params=remove_undefined(params),
         )
         return response['pruned']
 
@@ -624,7 +624,7 @@ class Guilds(BaseRouter):
         response = await self.request(
             'POST',
             Route('/guilds/{guild_id}/prune', guild_id=guild_id),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
         return response['pruned']
@@ -685,7 +685,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'PATCH',
             Route('/guilds/{guild_id}/widget', guild_id=guild_id),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
@@ -710,7 +710,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'GET',
             Route('/guilds/{guild_id}/widget.png', guild_id=guild_id),
-            query_params=remove_undefined(**params),
+            query_params=remove_undefined(params),
         )
 
     async def get_guild_welcome_screen(self, guild_id: Snowflake) -> WelcomeScreen:
@@ -736,7 +736,7 @@ class Guilds(BaseRouter):
         return await self.request(
             'PATCH',
             Route('/guilds/{guild_id}/welcome-screen', guild_id=guild_id),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
 
@@ -758,7 +758,7 @@ class Guilds(BaseRouter):
         await self.request(
             'PATCH',
             Route('/guilds/{guild_id}/voice-states/@me', guild_id=guild_id),
-            remove_undefined(**payload),
+            remove_undefined(payload),
         )
 
     async def modify_user_voice_state(
@@ -781,6 +781,6 @@ class Guilds(BaseRouter):
                 guild_id=guild_id,
                 user_id=user_id,
             ),
-            remove_undefined(**payload),
+            remove_undefined(payload),
             reason=reason,
         )
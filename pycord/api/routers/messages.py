@@ -64,7 +64,7 @@ class Messages(BaseRouter):
         return await self.request(
             'POST',
             Route('/channels/{channel_id}/messages', channel_id=channel_id),
-            remove_undefined(**data),
+            remove_undefined(data),
             files=files,
         )
 
@@ -163,7 +163,7 @@ class Messages(BaseRouter):
                 message_id=message_id,
                 emoji=emoji,
             ),
-            query_params=remove_undefined(**params),
+            query_params=remove_undefined(params),
         )
 
     async def delete_all_reactions(
@@ -227,7 +227,7 @@ class Messages(BaseRouter):
                 channel_id=channel_id,
                 message_id=message_id,
             ),
-            remove_undefined(**data),
+            remove_undefined(data),
             files=files,
         )
 
@@ -28,7 +28,6 @@ from .types import (
     ApplicationRoleConnectionMetadata as DiscordApplicationRoleConnectionMetadata,
 )
 from .user import LOCALE
-from .utils import remove_undefined
 
 __all__: Sequence[str] = ('ApplicationRoleConnectionMetadata',)
 
@@ -59,8 +58,11 @@ class ApplicationRoleConnectionMetadata:
         'description',
         'name_localizations',
         'description_localizations',
+        '_type_value',
     )
 
+    _OPTIONAL = ('name_localizations', 'description_localizations')
+
     def __init__(
         self,
         *,
@@ -72,6 +74,7 @@ class ApplicationRoleConnectionMetadata:
         description_localizations: Maybe[dict[LOCALE, str]] = MISSING,
     ) -> None:
         self.type: ApplicationRoleConnectionMetadataType = type
+        self._type_value: int = type.value
         self.key: str = key
         self.name: str = name
         self.description: str = description
@@ -87,17 +90,30 @@ class ApplicationRoleConnectionMetadata:
 
     @classmethod
     def from_dict(cls, data: dict[str, str]) -> ApplicationRoleConnectionMetadata:
-        type = ApplicationRoleConnectionMetadataType(data.pop('type'))
-        return cls(type=type, **data)
+        # bulk deserialization path: write the slots directly instead of
+        # routing every record through __init__'s keyword handling
+        self = object.__new__(cls)
+        self.type = type = ApplicationRoleConnectionMetadataType(data['type'])
+        self._type_value = type.value
+        self.key = data['key']
+        self.name = data['name']
+        self.description = data['description']
+        self.name_localizations = data.get('name_localizations', MISSING)
+        self.description_localizations = data.get('description_localizations', MISSING)
+        return self
 
     def to_dict(self) -> DiscordApplicationRoleConnectionMetadata:
-        return remove_undefined(
-            **{
-                'type': self.type.value,
-                'key': self.key,
-                'name': self.name,
-                'description': self.description,
-                'name_localizations': self.name_localizations,
-                'description_localizations': self.description_localizations,
-            }
-        )
+        payload = {
+            'type': self._type_value,
+            'key': self.key,
+            'name': self.name,
+            'description': self.description,
+        }
+
+        get = getattr
+        for k in self._OPTIONAL:
+            v = get(self, k)
+            if v is not MISSING:
+                payload[k] = v
+
+        return payload
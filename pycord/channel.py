@@ -21,9 +21,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from functools import cached_property
+from functools import partial
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
+from typing_extensions import TypedDict, Unpack
+
 from .embed import Embed
 from .enums import ChannelType, OverwriteType, VideoQualityMode
 from .errors import ComponentException
@@ -43,11 +46,23 @@ from .types import (
 )
 from .typing import Typing
 
+_fromiso = datetime.fromisoformat
+_get_id = attrgetter('id')
+
+# plain dict lookups skip the enum metaclass __call__ on every construction
+_CHANNEL_TYPE_BY_VALUE = {m.value: m for m in ChannelType}
+_OVERWRITE_TYPE_BY_VALUE = {m.value: m for m in OverwriteType}
+_VIDEO_QUALITY_MODE_BY_VALUE = {m.value: m for m in VideoQualityMode}
+
 if TYPE_CHECKING:
     from .state import State
     from .ui.house import House
 
 
+def _clean(**kwargs: Any) -> dict[str, Any]:
+    return {k: v for k, v in kwargs.items() if v is not MISSING}
+
+
 class _Overwrite:
     __slots__ = ('id', 'type', 'allow', 'deny')
 
@@ -66,19 +81,23 @@ class _Overwrite:
 
     @classmethod
     def from_dict(cls, overwrite: DiscordOverwrite) -> _Overwrite:
-        return cls(
-            int(overwrite['id']),
-            OverwriteType(overwrite['type']),
-            allow=Permissions.from_value(overwrite['allow']),
-            deny=Permissions.from_value(overwrite['deny']),
-        )
+        # called per overwrite per channel during guild sync; assign the
+        # slots directly instead of re-wrapping values through __init__
+        self = cls.__new__(cls)
+        self.id = Snowflake(overwrite['id'])
+        self.type = _OVERWRITE_TYPE_BY_VALUE[overwrite['type']]
+        self.allow = Permissions.from_value(overwrite['allow'])
+        self.deny = Permissions.from_value(overwrite['deny'])
+        return self
 
     def to_dict(self) -> DiscordOverwrite:
+        allow_value = self.allow.value
+        deny_value = self.deny.value
         return {
             'id': self.id,
             'type': self.type,
-            'allow': self.allow.value,
-            'deny': self.deny.value,
+            'allow': allow_value,
+            'deny': deny_value,
         }
 
 
@@ -86,29 +105,57 @@ class ThreadMetadata:
     __slots__ = (
         'archived',
         'auto_archive_duration',
-        'archive_timestamp',
         'locked',
         'invitable',
-        'create_timestamp',
+        '_archive_timestamp_raw',
+        '_archive_timestamp',
+        '_create_timestamp_raw',
+        '_create_timestamp',
     )
 
     def __init__(self, metadata: DiscordThreadMetadata) -> None:
         self.archived: bool = metadata['archived']
         self.auto_archive_duration: int = metadata['auto_archive_duration']
-        self.archive_timestamp: datetime = datetime.fromisoformat(
-            metadata['archive_timestamp']
-        )
         self.locked: bool = metadata['locked']
         self.invitable: bool | MissingEnum = metadata.get('invitable', MISSING)
-        self.create_timestamp: datetime | MissingEnum = (
-            datetime.fromisoformat(metadata.get('create_timestamp'))
-            if metadata.get('create_timestamp') is not None
-            else MISSING
-        )
+        # most thread objects are only routed, never inspected for their
+        # timestamps, so parsing is deferred until first access
+        self._archive_timestamp_raw: str = metadata['archive_timestamp']
+        self._archive_timestamp: datetime | None = None
+        self._create_timestamp_raw: str | None = metadata.get('create_timestamp')
+        self._create_timestamp: datetime | None = None
+
+    @property
+    def archive_timestamp(self) -> datetime:
+        archive_timestamp = self._archive_timestamp
+        if archive_timestamp is None:
+            archive_timestamp = self._archive_timestamp = _fromiso(
+                self._archive_timestamp_raw
+            )
+        return archive_timestamp
+
+    @property
+    def create_timestamp(self) -> datetime | MissingEnum:
+        if self._create_timestamp_raw is None:
+            return MISSING
+
+        create_timestamp = self._create_timestamp
+        if create_timestamp is None:
+            create_timestamp = self._create_timestamp = _fromiso(
+                self._create_timestamp_raw
+            )
+        return create_timestamp
 
 
 class ThreadMember:
-    __slots__ = ('id', 'user_id', 'join_timestamp', 'flags', 'member')
+    __slots__ = (
+        'id',
+        'user_id',
+        'join_timestamp',
+        'flags',
+        '_raw_member',
+        '_member',
+    )
 
     def __init__(self, member: DiscordThreadMember) -> None:
         _id: str | None = member.get('id')
@@ -119,11 +166,19 @@ class ThreadMember:
         self.user_id: Snowflake | MissingEnum = (
             Snowflake(_user_id) if _user_id is not None else MISSING
         )
-        self.join_timestamp: datetime = datetime.fromisoformat(member['join_timestamp'])
+        self.join_timestamp: datetime = _fromiso(member['join_timestamp'])
         self.flags: int = member['flags']
-        self.member: Member | None = (
-            Member(member['member']) if 'member' in member else None
-        )
+        # member payloads are large; keep the raw dict around and only
+        # build the Member object when somebody actually asks for it
+        self._raw_member: dict[str, Any] | None = member.get('member')
+        self._member: Member | None = None
+
+    @property
+    def member(self) -> Member | None:
+        member = self._member
+        if member is None and self._raw_member is not None:
+            member = self._member = Member(self._raw_member)
+        return member
 
 
 class ForumTag:
@@ -205,12 +260,11 @@ class Channel:
     def __init__(self, data: DiscordChannel, state: State) -> None:
         self._state = state
         self.id: Snowflake = Snowflake(data['id'])
-        self.type: ChannelType = ChannelType(data['type'])
+        self.type: ChannelType = _CHANNEL_TYPE_BY_VALUE[data['type']]
         self.name: str | MissingEnum = data.get('name', MISSING)
+        flags = data.get('flags')
         self.flags: ChannelFlags | MissingEnum = (
-            ChannelFlags.from_value(data['flags'])
-            if data.get('flags') is not None
-            else MISSING
+            ChannelFlags.from_value(flags) if flags is not None else MISSING
         )
 
     async def _base_edit(self, **kwargs: Any) -> Channel:
@@ -274,25 +328,32 @@ class GuildChannel(Channel):
     )
 
     def __init__(self, data: DiscordChannel, state: State) -> None:
-        super().__init__(data, state)
+        Channel.__init__(self, data, state)
+        GuildChannel._extra_init(self, data)
+
+    # field assignments split from __init__ so classes that inherit from
+    # several channel bases can chain the constructors explicitly instead
+    # of a cooperative super() walk that re-dispatches through the MRO
+    def _extra_init(self, data: DiscordChannel) -> None:
+        guild_id = data.get('guild_id')
         self.guild_id: Snowflake | MissingEnum = (
-            Snowflake(data['guild_id']) if data.get('guild_id') is not None else MISSING
+            Snowflake(guild_id) if guild_id is not None else MISSING
         )
         self.position: int | MissingEnum = data.get('position', MISSING)
-        self.permission_overwrites: list[_Overwrite] = [
-            _Overwrite.from_dict(d) for d in data.get('permission_overwrites', [])
-        ]
+        self.permission_overwrites: list[_Overwrite] = list(
+            map(_Overwrite.from_dict, data.get('permission_overwrites') or ())
+        )
         self.topic: str | None | MissingEnum = data.get('topic', MISSING)
         self.nsfw: bool | MissingEnum = data.get('nsfw', MISSING)
+        permissions = data.get('permissions')
         self.permissions: Permissions | MissingEnum = (
-            Permissions.from_value(data['permissions'])
-            if data.get('permissions') is not None
-            else MISSING
+            Permissions.from_value(permissions) if permissions is not None else MISSING
         )
+        parent_id = data.get('parent_id', MISSING)
         self.parent_id: Snowflake | MissingEnum = (
-            Snowflake(data['parent_id'])
-            if data.get('parent_id') is not None
-            else data.get('parent_id', MISSING)
+            Snowflake(parent_id)
+            if parent_id is not None and parent_id is not MISSING
+            else parent_id
         )
         self.rate_limit_per_user: int | MissingEnum = data.get(
             'rate_limit_per_user', MISSING
@@ -304,17 +365,21 @@ class GuildChannel(Channel):
 
 class MessageableChannel(Channel):
     def __init__(self, data: DiscordChannel, state: State) -> None:
-        super().__init__(data, state)
+        Channel.__init__(self, data, state)
+        MessageableChannel._extra_init(self, data)
+
+    def _extra_init(self, data: DiscordChannel) -> None:
+        last_message_id = data.get('last_message_id')
         self.last_message_id: int | None = (
-            Snowflake(data['last_message_id'])
-            if data.get('last_message_id') is not None
-            else None
+            Snowflake(last_message_id) if last_message_id is not None else None
         )
+        last_pin_timestamp = data.get('last_pin_timestamp', MISSING)
         self.last_pin_timestamp: None | datetime | MissingEnum = (
-            datetime.fromisoformat(data['last_pin_timestamp'])
-            if data.get('last_pin_timestamp') is not None
-            else data.get('last_pin_timestamp', MISSING)
+            _fromiso(last_pin_timestamp)
+            if last_pin_timestamp is not None and last_pin_timestamp is not MISSING
+            else last_pin_timestamp
         )
+        self._typing: Typing | None = None
 
     async def send(
         self,
@@ -334,10 +399,12 @@ class MessageableChannel(Channel):
             if len(houses) > 5:
                 raise ComponentException('Cannot have over five houses at once')
 
-            components = [(house.action_row())._to_dict() for house in houses]
-
+            # single pass: register each house while serializing its row
+            components = []
+            sent_house = self._state.sent_house
             for house in houses:
-                self._state.sent_house(house)
+                components.append(house.action_row()._to_dict())
+                sent_house(house)
         else:
             components = MISSING
 
@@ -360,13 +427,16 @@ class MessageableChannel(Channel):
         )
         return Message(data, state=self._state)
 
-    @cached_property
+    @property
     def typing(self) -> Typing:
-        return Typing(self.id, self._state)
+        typing = self._typing
+        if typing is None:
+            typing = self._typing = Typing(self.id, self._state)
+        return typing
 
     async def bulk_delete(self, *messages: Message, reason: str | None = None) -> None:
         await self._state.http.bulk_delete_messages(
-            self.id, [m.id for m in messages], reason=reason
+            self.id, list(map(_get_id, messages)), reason=reason
         )
 
     async def bulk_delete_ids(
@@ -376,11 +446,22 @@ class MessageableChannel(Channel):
 
 
 class AudioChannel(GuildChannel):
+    __slots__ = (
+        'rtc_region',
+        'video_quality_mode',
+        'bitrate',
+        'user_limit',
+    )
+
     def __init__(self, data: DiscordChannel, state: State) -> None:
-        super().__init__(data, state)
+        Channel.__init__(self, data, state)
+        GuildChannel._extra_init(self, data)
+        AudioChannel._extra_init(self, data)
+
+    def _extra_init(self, data: DiscordChannel) -> None:
         self.rtc_region: str | MissingEnum = data.get('rtc_region', MISSING)
         self.video_quality_mode: VideoQualityMode | MissingEnum = (
-            VideoQualityMode(data['video_quality_mode'])
+            _VIDEO_QUALITY_MODE_BY_VALUE[data['video_quality_mode']]
             if data.get('video_quality_mode') is not None
             else MISSING
         )
@@ -388,40 +469,44 @@ class AudioChannel(GuildChannel):
         self.user_limit: int | MissingEnum = data.get('user_limit', MISSING)
 
 
+class EditTextChannelKW(TypedDict, total=False):
+    name: str
+    type: ChannelType
+    position: int | None
+    topic: str | None
+    nsfw: bool | None
+    rate_limit_per_user: int | None
+    permission_overwrites: list[_Overwrite]
+    parent_id: Snowflake | None
+    default_auto_archive_duration: int | None
+    default_thread_rate_limit_per_user: int
+
+
 class TextChannel(MessageableChannel, GuildChannel):
     # Type 0
-    async def edit(
-        self,
-        *,
-        name: str | MissingEnum = MISSING,
-        type: ChannelType | MissingEnum = MISSING,
-        position: int | None | MissingEnum = MISSING,
-        topic: str | None | MissingEnum = MISSING,
-        nsfw: bool | None | MissingEnum = MISSING,
-        rate_limit_per_user: int | None | MissingEnum = MISSING,
-        permission_overwrites: list[_Overwrite] | MissingEnum = MISSING,
-        parent_id: Snowflake | None | MissingEnum = MISSING,
-        default_auto_archive_duration: int | None | MissingEnum = MISSING,
-        default_thread_rate_limit_per_user: int | MissingEnum = MISSING,
-    ) -> TextChannel:
-        return await self._base_edit(
-            name=name,
-            type=type.value if type else MISSING,
-            position=position,
-            topic=topic,
-            nsfw=nsfw,
-            rate_limit_per_user=rate_limit_per_user,
-            permission_overwrites=[o.to_dict() for o in permission_overwrites]
-            if permission_overwrites
-            else MISSING,
-            parent_id=parent_id,
-            default_auto_archive_duration=default_auto_archive_duration,
-            default_thread_rate_limit_per_user=default_thread_rate_limit_per_user,
-        )
+    __slots__ = ()
+
+    def __init__(self, data: DiscordChannel, state: State) -> None:
+        Channel.__init__(self, data, state)
+        GuildChannel._extra_init(self, data)
+        MessageableChannel._extra_init(self, data)
+
+    async def edit(self, **kwargs: Unpack[EditTextChannelKW]) -> TextChannel:
+        # only the keys the caller actually passed are present, so no
+        # MISSING defaults have to be loaded and filtered back out
+        type = kwargs.get('type')
+        if type is not None:
+            kwargs['type'] = type.value
+        permission_overwrites = kwargs.get('permission_overwrites')
+        if permission_overwrites is not None:
+            kwargs['permission_overwrites'] = [
+                o.to_dict() for o in permission_overwrites
+            ]
+        return await self._base_edit(**kwargs)
 
     async def get_pinned_messages(self) -> list[Message]:
         data = await self._state.http.get_pinned_messages(self.id)
-        return [Message(m, state=self._state) for m in data]
+        return list(map(partial(Message, state=self._state), data))
 
     async def create_thread(
         self,
@@ -453,52 +538,64 @@ class TextChannel(MessageableChannel, GuildChannel):
                 rate_limit_per_user=rate_limit_per_user,
                 reason=reason,
             )
-        return identify_channel(data, state=self._state)
+        # the response is always a thread payload, so the generic
+        # dispatch table lookup is unnecessary here
+        cls = AnnouncementThread if data['type'] == 10 else Thread
+        return cls(data, self._state)
 
-    async def list_public_archived_threads(
+    async def _list_archived(
         self,
-        before: datetime.datetime | MissingEnum = MISSING,
-        limit: int | MissingEnum = MISSING,
+        which: str,
+        before: datetime.datetime | MissingEnum,
+        limit: int | MissingEnum,
     ) -> list[Thread]:
-        data = await self._state.http.list_public_archived_threads(
+        data = await getattr(self._state.http, which)(
             self.id,
             before=before.isoformat() if before else MISSING,
             limit=limit,
         )
-        return [Thread(d, state=self._state) for d in data]
+        return list(map(partial(Thread, state=self._state), data))
+
+    async def list_public_archived_threads(
+        self,
+        before: datetime.datetime | MissingEnum = MISSING,
+        limit: int | MissingEnum = MISSING,
+    ) -> list[Thread]:
+        return await self._list_archived('list_public_archived_threads', before, limit)
 
     async def list_private_archived_threads(
         self,
         before: datetime.datetime | MissingEnum = MISSING,
         limit: int | MissingEnum = MISSING,
     ) -> list[Thread]:
-        data = await self._state.http.list_private_archived_threads(
-            self.id,
-            before=before.isoformat() if before else MISSING,
-            limit=limit,
-        )
-        return [Thread(d, state=self._state) for d in data]
+        return await self._list_archived('list_private_archived_threads', before, limit)
 
     async def list_joined_private_archived_threads(
         self,
         before: datetime.datetime | MissingEnum = MISSING,
         limit: int | MissingEnum = MISSING,
     ) -> list[Thread]:
-        data = await self._state.http.list_joined_private_archived_threads(
-            self.id,
-            before=before.isoformat() if before else MISSING,
-            limit=limit,
+        return await self._list_archived(
+            'list_joined_private_archived_threads', before, limit
         )
-        return [Thread(d, state=self._state) for d in data]
 
 
 class DMChannel(MessageableChannel):
     # Type 1
+    __slots__ = ()
     ...
 
 
 class VoiceChannel(MessageableChannel, AudioChannel):
     # Type 2
+    __slots__ = ()
+
+    def __init__(self, data: DiscordChannel, state: State) -> None:
+        Channel.__init__(self, data, state)
+        GuildChannel._extra_init(self, data)
+        AudioChannel._extra_init(self, data)
+        MessageableChannel._extra_init(self, data)
+
     async def edit(
         self,
         *,
@@ -513,24 +610,28 @@ class VoiceChannel(MessageableChannel, AudioChannel):
         video_quality_mode: VideoQualityMode | None | MissingEnum = MISSING,
     ) -> VoiceChannel:
         return await self._base_edit(
-            name=name,
-            position=position,
-            nsfw=nsfw,
-            bitrate=bitrate,
-            user_limit=user_limit,
-            permission_overwrites=[o.to_dict() for o in permission_overwrites]
-            if permission_overwrites
-            else MISSING,
-            parent_id=parent_id,
-            rtc_region=rtc_region,
-            video_quality_mode=video_quality_mode.value
-            if video_quality_mode
-            else MISSING,
+            **_clean(
+                name=name,
+                position=position,
+                nsfw=nsfw,
+                bitrate=bitrate,
+                user_limit=user_limit,
+                permission_overwrites=[o.to_dict() for o in permission_overwrites]
+                if permission_overwrites
+                else MISSING,
+                parent_id=parent_id,
+                rtc_region=rtc_region,
+                video_quality_mode=video_quality_mode.value
+                if video_quality_mode
+                else MISSING,
+            )
         )
 
 
 class GroupDMChannel(MessageableChannel):
     # Type 3
+    __slots__ = ()
+
     async def edit(
         self,
         *,
@@ -543,6 +644,8 @@ class GroupDMChannel(MessageableChannel):
 
 class CategoryChannel(Channel):
     # Type 4
+    __slots__ = ()
+
     async def edit(
         self,
         *,
@@ -551,16 +654,20 @@ class CategoryChannel(Channel):
         permission_overwrites: list[_Overwrite] | MissingEnum = MISSING,
     ) -> CategoryChannel:
         return await self._base_edit(
-            name=name,
-            position=position,
-            permission_overwrites=[o.to_dict() for o in permission_overwrites]
-            if permission_overwrites
-            else MISSING,
+            **_clean(
+                name=name,
+                position=position,
+                permission_overwrites=[o.to_dict() for o in permission_overwrites]
+                if permission_overwrites
+                else MISSING,
+            )
         )
 
 
 class AnnouncementChannel(TextChannel):
     # Type 5
+    __slots__ = ()
+
     async def follow(self, target_channel: TextChannel) -> FollowedChannel:
         data = await self._state.http.follow_news_channel(self.id, target_channel.id)
         return FollowedChannel(data)
@@ -588,8 +695,17 @@ class AnnouncementChannel(TextChannel):
 
 class Thread(MessageableChannel, GuildChannel):
     # Type 11 & 12
+    __slots__ = (
+        'default_thread_rate_limit_per_user',
+        'message_count',
+        'thread_metadata',
+        'owner_id',
+    )
+
     def __init__(self, data: DiscordChannel, state: State) -> None:
-        super().__init__(data, state)
+        Channel.__init__(self, data, state)
+        GuildChannel._extra_init(self, data)
+        MessageableChannel._extra_init(self, data)
         self.default_thread_rate_limit_per_user: int | MissingEnum = data.get(
             'default_thread_rate_limit_per_user', MissingEnum
         )
@@ -616,14 +732,16 @@ class Thread(MessageableChannel, GuildChannel):
         applied_tags: list[ForumTag] | MissingEnum = MISSING,
     ) -> Thread:
         return await self._base_edit(
-            name=name,
-            archived=archived,
-            auto_archive_duration=auto_archive_duration,
-            locked=locked,
-            invitable=invitable,
-            rate_limit_per_user=rate_limit_per_user,
-            flags=flags.value if flags else MISSING,
-            applied_tags=[t.id for t in applied_tags] if applied_tags else MISSING,
+            **_clean(
+                name=name,
+                archived=archived,
+                auto_archive_duration=auto_archive_duration,
+                locked=locked,
+                invitable=invitable,
+                rate_limit_per_user=rate_limit_per_user,
+                flags=flags.value if flags else MISSING,
+                applied_tags=[t.id for t in applied_tags] if applied_tags else MISSING,
+            )
         )
 
     async def join(self) -> None:
@@ -661,6 +779,8 @@ class Thread(MessageableChannel, GuildChannel):
 
 class AnnouncementThread(Thread):
     # Type 10
+    __slots__ = ()
+
     async def edit(
         self,
         *,
@@ -671,16 +791,26 @@ class AnnouncementThread(Thread):
         rate_limit_per_user: int | MissingEnum = MISSING,
     ) -> AnnouncementThread:
         return await self._base_edit(
-            name=name,
-            archived=archived,
-            auto_archive_duration=auto_archive_duration,
-            locked=locked,
-            rate_limit_per_user=rate_limit_per_user,
+            **_clean(
+                name=name,
+                archived=archived,
+                auto_archive_duration=auto_archive_duration,
+                locked=locked,
+                rate_limit_per_user=rate_limit_per_user,
+            )
         )
 
 
 class StageChannel(AudioChannel, MessageableChannel):
     # Type 13
+    __slots__ = ()
+
+    def __init__(self, data: DiscordChannel, state: State) -> None:
+        Channel.__init__(self, data, state)
+        GuildChannel._extra_init(self, data)
+        AudioChannel._extra_init(self, data)
+        MessageableChannel._extra_init(self, data)
+
     async def edit(
         self,
         *,
@@ -695,29 +825,39 @@ class StageChannel(AudioChannel, MessageableChannel):
         video_quality_mode: VideoQualityMode | None | MissingEnum = MISSING,
     ) -> StageChannel:
         return await self._base_edit(
-            name=name,
-            position=position,
-            nsfw=nsfw,
-            bitrate=bitrate,
-            user_limit=user_limit,
-            permission_overwrites=[o.to_dict() for o in permission_overwrites]
-            if permission_overwrites
-            else MISSING,
-            parent_id=parent_id,
-            rtc_region=rtc_region,
-            video_quality_mode=video_quality_mode.value
-            if video_quality_mode
-            else MISSING,
+            **_clean(
+                name=name,
+                position=position,
+                nsfw=nsfw,
+                bitrate=bitrate,
+                user_limit=user_limit,
+                permission_overwrites=[o.to_dict() for o in permission_overwrites]
+                if permission_overwrites
+                else MISSING,
+                parent_id=parent_id,
+                rtc_region=rtc_region,
+                video_quality_mode=video_quality_mode.value
+                if video_quality_mode
+                else MISSING,
+            )
         )
 
 
 class DirectoryChannel(Channel):
     # Type 14
+    __slots__ = ()
     ...
 
 
 class ForumChannel(Channel):
     # Type 15
+    __slots__ = (
+        'default_sort_order',
+        'default_reaction_emoji',
+        'available_tags',
+        '_available_tag_ids',
+    )
+
     def __init__(self, data: DiscordChannel, state: State) -> None:
         super().__init__(data, state)
         self.default_sort_order: int | None | MissingEnum = data.get(
@@ -728,9 +868,18 @@ class ForumChannel(Channel):
             if data.get('default_reaction_emoji') is not None
             else MISSING
         )
-        self.available_tags: list[ForumTag] = [
-            ForumTag.from_dict(d) for d in data.get('available_tags', [])
-        ]
+        self.available_tags: list[ForumTag] = list(
+            map(ForumTag.from_dict, data.get('available_tags') or ())
+        )
+        # parallel tuple of ids so bulk tag operations don't have to walk
+        # the tag objects attribute-by-attribute every time
+        self._available_tag_ids: tuple[Snowflake, ...] = tuple(
+            tag.id for tag in self.available_tags
+        )
+
+    @property
+    def available_tag_ids(self) -> tuple[Snowflake, ...]:
+        return self._available_tag_ids
 
     async def edit(
         self,
@@ -747,61 +896,60 @@ class ForumChannel(Channel):
         available_tags: list[ForumTag] | MissingEnum = MISSING,
     ) -> ForumChannel:
         return await self._base_edit(
-            name=name,
-            position=position,
-            topic=topic,
-            nsfw=nsfw,
-            rate_limit_per_user=rate_limit_per_user,
-            permission_overwrites=[o.to_dict() for o in permission_overwrites]
-            if permission_overwrites
-            else MISSING,
-            parent_id=parent_id,
-            default_auto_archive_duration=default_auto_archive_duration,
-            flags=flags.value if flags else MISSING,
-            available_tags=[t.to_dict() for t in available_tags]
-            if available_tags
-            else MISSING,
+            **_clean(
+                name=name,
+                position=position,
+                topic=topic,
+                nsfw=nsfw,
+                rate_limit_per_user=rate_limit_per_user,
+                permission_overwrites=[o.to_dict() for o in permission_overwrites]
+                if permission_overwrites
+                else MISSING,
+                parent_id=parent_id,
+                default_auto_archive_duration=default_auto_archive_duration,
+                flags=flags.value if flags else MISSING,
+                available_tags=[t.to_dict() for t in available_tags]
+                if available_tags
+                else MISSING,
+            )
         )
 
 
-CHANNEL_TYPE = (
-    TextChannel
-    | DMChannel
-    | VoiceChannel
-    | GroupDMChannel
-    | CategoryChannel
-    | AnnouncementChannel
-    | AnnouncementThread
-    | Thread
-    | StageChannel
-    | DirectoryChannel
-    | ForumChannel
-    | Channel
-)
+if TYPE_CHECKING:
+    CHANNEL_TYPE = (
+        TextChannel
+        | DMChannel
+        | VoiceChannel
+        | GroupDMChannel
+        | CategoryChannel
+        | AnnouncementChannel
+        | AnnouncementThread
+        | Thread
+        | StageChannel
+        | DirectoryChannel
+        | ForumChannel
+        | Channel
+    )
+else:
+    # the union is only consumed in annotations, which are strings under
+    # PEP 563; a runtime alias avoids allocating the UnionType at import
+    CHANNEL_TYPE = Channel
+
+
+CHANNEL_DISPATCH: dict[int, type[Channel]] = {
+    0: TextChannel,
+    1: DMChannel,
+    2: VoiceChannel,
+    4: CategoryChannel,
+    5: AnnouncementChannel,
+    10: AnnouncementThread,
+    11: Thread,
+    12: Thread,
+    13: StageChannel,
+    14: DirectoryChannel,
+    15: ForumChannel,
+}
 
 
 def identify_channel(data: dict[str, Any], state: State) -> CHANNEL_TYPE:
-    type = data['type']
-
-    if type == 0:
-        return TextChannel(data, state)
-    elif type == 1:
-        return DMChannel(data, state)
-    elif type == 2:
-        return VoiceChannel(data, state)
-    elif type == 4:
-        return CategoryChannel(data, state)
-    elif type == 5:
-        return AnnouncementChannel(data, state)
-    elif type == 10:
-        return AnnouncementThread(data, state)
-    elif type in (11, 12):
-        return Thread(data, state)
-    elif type == 13:
-        return StageChannel(data, state)
-    elif type == 14:
-        return DirectoryChannel(data, state)
-    elif type == 15:
-        return ForumChannel(data, state)
-    else:
-        return Channel(data, state)
+    return CHANNEL_DISPATCH.get(data['type'], Channel)(data, state)
@@ -19,6 +19,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE
 
+from functools import lru_cache
+
 
 class Color:
     """Represents the default discord colors.
@@ -31,6 +33,15 @@ class Color:
 
         self.value: int = value
 
+    @classmethod
+    def from_int(cls, value: int) -> 'Color':
+        """Like ``Color(value)``, but returns a shared cached instance.
+
+        Role colors have low cardinality across a guild, so construction
+        sites on hot paths should prefer this over the constructor.
+        """
+        return _cached_color(value)
+
     @classmethod
     def default(cls) -> 'Color':
         """A factory color method which returns `0`"""
@@ -155,3 +166,8 @@ class Color:
     def yellow(cls) -> 'Color':
         """A factory color method which returns `0xFEE75C`"""
         return cls(0xFEE75C)
+
+
+@lru_cache(maxsize=256)
+def _cached_color(value: int) -> Color:
+    return Color(value)
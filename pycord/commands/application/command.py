@@ -21,7 +21,6 @@
 from __future__ import annotations
 
 import asyncio
-from copy import copy
 from inspect import isclass
 from typing import TYPE_CHECKING, Any, Sequence, Union, get_origin
 
@@ -53,12 +52,12 @@ __all__: Sequence[str] = ('CommandChoice', 'Option', 'ApplicationCommand')
 async def _autocomplete(
     _: Interaction, option: Option, string: str
 ) -> list[dict[str, Any]]:
-    string = str(string).lower()
-    return [
-        choice._to_dict()
-        for choice in option._choices
-        if string in str(choice.value).lower()
-    ]
+    # the lowercase values and serialized forms are precomputed at
+    # registration, so each keystroke is just a substring scan
+    if string.__class__ is not str:
+        string = str(string)
+    string = string.lower()
+    return [d for lower, d in option._choices_indexed if string in lower]
 
 
 class CommandChoice:
@@ -75,6 +74,8 @@ class CommandChoice:
         Dictionary of localizations
     """
 
+    __slots__ = ('name', 'value', '_lower_value', 'name_localizations', '_dict')
+
     def __init__(
         self,
         name: str,
@@ -82,19 +83,20 @@ class CommandChoice:
         value: str | int | float | None = None,
     ) -> None:
         self.name = name
-
-        if value is None:
-            self.value = name
-
+        self.value = name if value is None else value
+        self._lower_value = str(self.value).lower()
         self.name_localizations = name_localizations
-
-    def _to_dict(self) -> dict[str, Any]:
-        return {
+        # choices never change after construction, so the wire form can
+        # be built once and handed out by reference
+        self._dict = {
             'name': self.name,
             'value': self.value,
             'name_localizations': self.name_localizations,
         }
 
+    def _to_dict(self) -> dict[str, Any]:
+        return self._dict
+
 
 _OPTION_BIND = {
     str: ApplicationCommandOptionType.STRING,
@@ -107,6 +109,40 @@ _OPTION_BIND = {
     Attachment: ApplicationCommandOptionType.ATTACHMENT,
 }
 
+# .value resolved ahead of time so registration does a single dict hit
+_OPTION_BIND_VALUE = {k: v.value for k, v in _OPTION_BIND.items()}
+
+# one hash lookup instead of a chain of != comparisons per argument
+_USER_CMD_ALLOWED = frozenset({Member, User, Interaction, Union[User, Member]})
+_MESSAGE_CMD_ALLOWED = frozenset(
+    {Message, Interaction, User, Member, Union[User, Member]}
+)
+
+
+class _OptionView:
+    """Per-interaction view over a registered option.
+
+    Only the fields that differ per invocation are stored; everything
+    else falls through to the template option.
+    """
+
+    __slots__ = ('_base', 'focused', 'value', 'options')
+
+    def __init__(
+        self,
+        base: Option,
+        focused: bool | MissingEnum,
+        value: str | int | float | MissingEnum,
+        options: list[InteractionOption],
+    ) -> None:
+        self._base = base
+        self.focused = focused
+        self.value = value
+        self.options = options
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base, name)
+
 
 class Option:
     """
@@ -141,7 +177,30 @@ class Option:
         Whether to implement autocomplete or not
     """
 
-    _level: int = 0
+    __slots__ = (
+        'type',
+        'autocompleter',
+        'name',
+        'name_localizations',
+        'description',
+        'description_localizations',
+        'required',
+        'choices',
+        '_choices',
+        '_choices_indexed',
+        'options',
+        'channel_types',
+        'min_value',
+        'max_value',
+        'autocomplete',
+        '_subs',
+        '_dict_cache',
+        '_level',
+        'focused',
+        'value',
+        '_param',
+        '_callback',
+    )
 
     def __init__(
         self,
@@ -164,7 +223,7 @@ class Option:
         if isinstance(type, ApplicationCommandOptionType):
             self.type = type.value
         elif not isinstance(type, int):
-            self.type = _OPTION_BIND[type].value
+            self.type = _OPTION_BIND_VALUE[type]
         else:
             self.type = type
         self.autocompleter = autocompleter
@@ -175,15 +234,12 @@ class Option:
         self.required = required
         if autocomplete:
             self.choices = []
-            if choices:
-                self._choices = [choice for choice in choices if choices]
-            else:
-                self._choices = []
+            self._choices = list(choices) if choices else []
+            self._choices_indexed = [
+                (choice._lower_value, choice._dict) for choice in self._choices
+            ]
         else:
-            if choices:
-                self.choices = [choice._to_dict() for choice in choices]
-            else:
-                self.choices = MISSING
+            self.choices = [choice._dict for choice in choices] if choices else MISSING
         if options is MISSING:
             self.options = []
         else:
@@ -193,6 +249,9 @@ class Option:
         self.max_value = max_value
         self.autocomplete = autocomplete
         self._subs = {}
+        self._dict_cache: dict[str, Any] | None = None
+        self._level: int = 0
+        self._callback: AsyncFunc | None = None
 
         if TYPE_CHECKING:
             self.focused: bool | MissingEnum = MISSING
@@ -240,16 +299,25 @@ class Option:
     def __get__(self):
         return self.value
 
-    def _inter_copy(self, data: InteractionOption) -> Option:
-        c = copy(self)
+    def _inter_copy(self, data: InteractionOption) -> _OptionView:
+        # copy.copy duplicates the whole attribute dict per option per
+        # interaction; a slim view only holds the three overrides
+        return _OptionView(self, data.focused, data.value, data.options)
+
+    def _convert_to_group(self) -> None:
+        # first sub command attached: this option stops being invokable
+        # itself and only carries its children from here on
+        self.options = []
+        self._callback = None
 
-        c.focused = data.focused
-        c.value = data.value
-        c.options = data.options
-        return c
+        if self.type == 1:
+            self.type = 2
 
     def to_dict(self) -> dict[str, Any]:
-        return remove_undefined(
+        cached = self._dict_cache
+        if cached is not None:
+            return cached
+        cached = self._dict_cache = remove_undefined(
             type=self.type,
             name=self.name,
             name_localizations=self.name_localizations,
@@ -265,6 +333,7 @@ class Option:
             max_value=self.max_value,
             autocomplete=self.autocomplete,
         )
+        return cached
 
     def command(
         self,
@@ -305,23 +374,133 @@ class Option:
 
             command._level = self._level + 1
 
-            if self._subs == {}:
-                self.options = []
-                self._callback = None
+            if not self._subs:
+                self._convert_to_group()
 
             self.options.append(command)
 
             self._subs[name] = command
 
-            if self.type == 1:
-                # turn into a command group
-                self.type = 2
+            # adding a sub command changes the serialized form
+            self._dict_cache = None
 
             return command
 
         return wrapper
 
 
+def _h_scalar(
+    state: State,
+    guild_id: Snowflake | None,
+    resolved: dict[str, Any],
+    option: InteractionOption,
+    o: Option,
+    pairs: list[tuple[str, Any]],
+) -> None:
+    pairs.append((o._param, o._inter_copy(option).value))
+
+
+def _resolve_user_like(
+    state: State,
+    guild_id: Snowflake | None,
+    resolved: dict[str, Any],
+    value: str,
+) -> Member | User:
+    user = User(resolved['users'][value], state)
+
+    if guild_id:
+        member = Member(
+            resolved['members'][value],
+            state,
+            guild_id=guild_id,
+        )
+        member.user = user
+        return member
+    return user
+
+
+def _h_user(
+    state: State,
+    guild_id: Snowflake | None,
+    resolved: dict[str, Any],
+    option: InteractionOption,
+    o: Option,
+    pairs: list[tuple[str, Any]],
+) -> None:
+    pairs.append(
+        (o._param, _resolve_user_like(state, guild_id, resolved, option.value))
+    )
+
+
+def _h_channel(
+    state: State,
+    guild_id: Snowflake | None,
+    resolved: dict[str, Any],
+    option: InteractionOption,
+    o: Option,
+    pairs: list[tuple[str, Any]],
+) -> None:
+    pairs.append(
+        (o._param, identify_channel(resolved['channels'][option.value], state))
+    )
+
+
+def _h_role(
+    state: State,
+    guild_id: Snowflake | None,
+    resolved: dict[str, Any],
+    option: InteractionOption,
+    o: Option,
+    pairs: list[tuple[str, Any]],
+) -> None:
+    pairs.append((o._param, Role(resolved['roles'][option.value], state)))
+
+
+def _h_mentionable(
+    state: State,
+    guild_id: Snowflake | None,
+    resolved: dict[str, Any],
+    option: InteractionOption,
+    o: Option,
+    pairs: list[tuple[str, Any]],
+) -> None:
+    if resolved.get('roles'):
+        pairs.append((o._param, Role(resolved['roles'][option.value], state)))
+    else:
+        pairs.append(
+            (o._param, _resolve_user_like(state, guild_id, resolved, option.value))
+        )
+
+
+def _h_attachment(
+    state: State,
+    guild_id: Snowflake | None,
+    resolved: dict[str, Any],
+    option: InteractionOption,
+    o: Option,
+    pairs: list[tuple[str, Any]],
+) -> None:
+    pairs.append((o._param, Attachment(resolved['attachments'][option.value], state)))
+
+
+# indexed by option type; types 1 and 2 stay special-cased in
+# _process_options because they await
+_TYPE_HANDLERS = (
+    None,
+    None,
+    None,
+    _h_scalar,
+    _h_scalar,
+    _h_scalar,
+    _h_user,
+    _h_channel,
+    _h_role,
+    _h_mentionable,
+    _h_scalar,
+    _h_attachment,
+)
+
+
 class ApplicationCommand(Command):
     """
     Commands deployed to Discord by Applications
@@ -351,6 +530,24 @@ class ApplicationCommand(Command):
         The default member permissions for this command.
     """
 
+    __slots__ = (
+        'type',
+        'guild_id',
+        'name_localizations',
+        'description',
+        'description_localizations',
+        'dm_permission',
+        'nsfw',
+        '_options',
+        '_subs',
+        '_created',
+        'default_member_permissions',
+        'options',
+        '_options_dict',
+        '_user_command_field',
+        'id',
+    )
+
     _processor_event = InteractionCreate(Context)
     sub_level: int = 0
 
@@ -436,10 +633,12 @@ class ApplicationCommand(Command):
             command._callback = func
             command._level = 1
 
-            if self._subs == {}:
-                self.options = []
-                self._options_dict = {}
-                self._options = []
+            if not self._subs:
+                # first sub command: clear the parsed containers in place
+                # instead of rebinding fresh ones
+                self.options.clear()
+                self._options_dict.clear()
+                self._options.clear()
                 self._callback = None
 
             self.options.append(command)
@@ -465,12 +664,7 @@ class ApplicationCommand(Command):
 
             i += 1
 
-            if (
-                arg[1] != Member
-                and arg[1] != User
-                and arg[1] != Interaction
-                and arg[1] != Union[User, Member]
-            ):
+            if arg[1] not in _USER_CMD_ALLOWED:
                 raise ApplicationCommandException(
                     'Command argument incorrectly type hinted'
                 )
@@ -496,13 +690,7 @@ class ApplicationCommand(Command):
 
             i += 1
 
-            if (
-                arg[1] != Message
-                and arg[1] != Interaction
-                and arg[1] != User
-                and arg[1] != Member
-                and arg[1] != Union[User, Member]
-            ):
+            if arg[1] not in _MESSAGE_CMD_ALLOWED:
                 raise ApplicationCommandException(
                     'Command argument incorrectly type hinted'
                 )
@@ -531,17 +719,24 @@ class ApplicationCommand(Command):
             elif v[1] is Interaction or v[1] is Context:
                 continue
 
-            args = get_args(v[1])
+            default = v[0]
 
-            if not isinstance(args[1], Option):
-                raise ApplicationCommandException(
-                    f'Options may only be of type Option, not {args[1]}'
-                )
+            if isinstance(default, Option):
+                # common path: the Option is the default value, no
+                # Annotated reflection needed
+                option: Option = default
+            else:
+                args = get_args(v[1])
+
+                if not isinstance(args[1], Option):
+                    raise ApplicationCommandException(
+                        f'Options may only be of type Option, not {args[1]}'
+                    )
 
-            option: Option = args[1]
+                option = args[1]
+                option.type = _OPTION_BIND_VALUE[args[0]]
 
             option._param = name
-            option.type = _OPTION_BIND[args[0]].value
 
             if not option.name:
                 option.name = name
@@ -549,8 +744,20 @@ class ApplicationCommand(Command):
             self.options.append(option)
             self._options_dict[option.name] = option
 
-        for option in self.options:
-            self._options.append(option.to_dict())
+        self._options = [option.to_dict() for option in self.options]
+
+    def _registration_payload(self) -> dict[str, Any]:
+        return remove_undefined(
+            name=self.name,
+            name_localizations=self.name_localizations,
+            description=self.description,
+            description_localizations=self.description_localizations,
+            type=self.type,
+            options=self._options,
+            dm_permission=self.dm_permission,
+            nsfw=self.nsfw,
+            default_member_permissions=self.default_member_permissions,
+        )
 
     async def instantiate(self) -> None:
         if self.guild_id:
@@ -648,10 +855,22 @@ class ApplicationCommand(Command):
         options: list[InteractionOption],
         grouped: bool = False,
     ) -> dict[str, Any]:
-        binding = {}
+        # collect pairs and build the dict once at the end so CPython
+        # can size the table for the full option count up front
+        pairs: list[tuple[str, Any]] = []
+        # resolve the shared lookups once per invocation instead of per
+        # option arm
+        state = self._state
+        guild_id = interaction.guild_id
+        resolved = interaction.data.get('resolved') or {}
+        options_dict = self._options_dict
         for option in options:
-            o = self._options_dict[option.name]
-            if option.type == 1:
+            o = options_dict[option.name]
+            # single int local lets Cython lower the chain to a C switch
+            # when this module is compiled, and saves the repeated
+            # attribute load when it is not
+            opt_type = option.type
+            if opt_type == 1:
                 sub = self._subs[option.name]
 
                 opts = await self._process_options(
@@ -660,64 +879,15 @@ class ApplicationCommand(Command):
                 if not grouped:
                     await self._callback(interaction)
                 await sub._callback(interaction, **opts)
-            elif option.type == 2:
+            elif opt_type == 2:
                 await self._callback(interaction)
                 await self._process_options(
                     interaction=interaction, options=option.options, grouped=True
                 )
-            elif option.type in (3, 4, 5, 10):
-                binding[o._param] = o._inter_copy(option).value
-            elif option.type == 6:
-                user = User(
-                    interaction.data['resolved']['users'][option.value], self._state
-                )
-
-                if interaction.guild_id:
-                    member = Member(
-                        interaction.data['resolved']['members'][option.value],
-                        self._state,
-                        guild_id=interaction.guild_id,
-                    )
-                    member.user = user
-
-                    binding[o._param] = member
-                else:
-                    binding[o._param] = user
-            elif option.type == 7:
-                binding[o._param] = identify_channel(
-                    interaction.data['resolved']['channels'][option.value], self._state
-                )
-            elif option.type == 8:
-                binding[o._param] = Role(
-                    interaction.data['resolved']['roles'][option.value], self._state
-                )
-            elif option.type == 9:
-                if interaction.data['resolved'].get('roles'):
-                    binding[o._param] = Role(
-                        interaction.data['resolved']['roles'][option.value], self._state
-                    )
-                else:
-                    user = User(
-                        interaction.data['resolved']['users'][option.value], self._state
-                    )
-
-                    if interaction.guild_id:
-                        member = Member(
-                            interaction.data['resolved']['members'][option.value],
-                            self._state,
-                        )
-                        member.user = user
-
-                        binding[o._param] = member
-                    else:
-                        binding[o._param] = user
-            elif option.type == 11:
-                binding[o._param] = Attachment(
-                    interaction.data['resolved']['attachments'][option.value],
-                    self._state,
-                )
+            else:
+                _TYPE_HANDLERS[opt_type](state, guild_id, resolved, option, o, pairs)
 
-        return binding
+        return dict(pairs)
 
     def _process_user_command(self, inter: Interaction) -> User | Member:
         if inter.member:
@@ -731,39 +901,37 @@ class ApplicationCommand(Command):
         else:
             interaction = event
 
+        # interactions are routed here by (type, name) - via
+        # State._dispatch_application_command or the HTTP-interactions
+        # server - so the name is already known to target this command
         if interaction.type == 4:
-            if interaction.data.get('name') is not None:
-                if interaction.data['name'] == self.name:
-                    option = interaction.data['options'][0]
-                    real_option = self._options_dict[option['name']]
-                    choices = await real_option.autocompleter(
-                        interaction, real_option, option['value']
-                    )
+            option = interaction.data['options'][0]
+            real_option = self._options_dict[option['name']]
+            choices = await real_option.autocompleter(
+                interaction, real_option, option['value']
+            )
 
-                    await interaction.response.autocomplete(choices)
+            await interaction.response.autocomplete(choices)
             return
 
-        if interaction.data:
-            if interaction.data.get('name') is not None:
-                if interaction.data['name'] == self.name:
-                    if interaction.data['type'] == 1:
-                        binding = await self._process_options(
-                            interaction, interaction.options
-                        )
+        data = interaction.data
 
-                        if self._callback:
-                            await self._callback(interaction, **binding)
-                    elif interaction.data['type'] == 2:
-                        user_binding = self._process_user_command(interaction)
-
-                        await self._callback(interaction, user_binding)
-                    elif interaction.data['type'] == 3:
-                        message = Message(
-                            interaction.data['resolved']['messages'][
-                                interaction.data['target_id']
-                            ],
-                            self._state,
-                        )
-                        requester = self._process_user_command(interaction)
+        if data:
+            command_type = data['type']
+            if command_type == 1:
+                binding = await self._process_options(interaction, interaction.options)
+
+                if self._callback:
+                    await self._callback(interaction, **binding)
+            elif command_type == 2:
+                user_binding = self._process_user_command(interaction)
+
+                await self._callback(interaction, user_binding)
+            elif command_type == 3:
+                message = Message(
+                    data['resolved']['messages'][data['target_id']],
+                    self._state,
+                )
+                requester = self._process_user_command(interaction)
 
-                        await self._callback(interaction, message, requester)
+                await self._callback(interaction, message, requester)
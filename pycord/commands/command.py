@@ -31,6 +31,8 @@ if TYPE_CHECKING:
 
 
 class Command:
+    __slots__ = ('_callback', 'name', 'group', '_state')
+
     _processor_event: Type[Event] | Event
 
     def __init__(
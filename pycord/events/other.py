@@ -55,22 +55,55 @@ class Ready(Event):
                 )
 
             state.application_commands = []
-            state.application_commands.extend(
-                await state.http.get_global_application_commands(state.user.id, True)
-            )
             state._application_command_names: list[str] = []
 
+            if not state.update_commands:
+                # the per-command fallback path compares against the
+                # currently deployed commands
+                state.application_commands.extend(
+                    await state.http.get_global_application_commands(
+                        state.user.id, True
+                    )
+                )
+
+            # imported here to dodge the command module's import of
+            # InteractionCreate below
+            from ..commands.application import ApplicationCommand
+
+            # application commands are routed through one dispatcher and
+            # a (type, name) map instead of fanning every interaction out
+            # to every command's _invoke
+            dispatching_events: list[Event] = []
+
             for command in state.commands:
-                await command.instantiate()
-                state.event_manager.add_event(command._processor_event, command._invoke)
+                if isinstance(command, ApplicationCommand):
+                    if not state.update_commands:
+                        await command.instantiate()
+                    state._commands_by_name[(command.type, command.name)] = command
+                    if command._processor_event not in dispatching_events:
+                        state.event_manager.add_event(
+                            command._processor_event,
+                            state._dispatch_application_command,
+                        )
+                        dispatching_events.append(command._processor_event)
+                else:
+                    await command.instantiate()
+                    state.event_manager.add_event(
+                        command._processor_event, command._invoke
+                    )
                 if hasattr(command, 'name'):
                     state._application_command_names.append(command.name)
 
-            for app_command in state.application_commands:
-                if app_command['name'] not in state._application_command_names:
-                    await state.http.delete_global_application_command(
-                        state.user.id.real, app_command['id']
-                    )
+            if state.update_commands:
+                # one bulk overwrite per scope registers everything and
+                # drops stale commands in the same request
+                await state._bulk_register_commands()
+            else:
+                for app_command in state.application_commands:
+                    if app_command['name'] not in state._application_command_names:
+                        await state.http.delete_global_application_command(
+                            state.user.id.real, app_command['id']
+                        )
 
 
 class Hook(Event):
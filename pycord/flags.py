@@ -22,6 +22,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Sequence, Type, TypeVar
 
 from .errors import FlagException
@@ -73,6 +74,11 @@ def fill() -> Callable[[Type[F]], Type[F]]:
     return wrapper
 
 
+@lru_cache(maxsize=512)
+def _parse_flags(cls: Type[F], value: int) -> dict[str, bool]:
+    return {name: True for name, bit in cls._FLAGS.items() if value & bit}
+
+
 class Flags:
     _FLAGS = {}
 
@@ -95,12 +101,10 @@ class Flags:
     @classmethod
     def from_value(cls: Type[FF], value: int | str) -> FF:
         self = cls()
-        value = int(value)
-
-        for name, bit in self._FLAGS.items():
-            if value & bit:
-                self._values[name] = True
-
+        # bitmasks repeat heavily (role permissions, message flags), so
+        # each distinct value is parsed once; instances get their own
+        # copy of the dict and stay independently mutable
+        self._values = _parse_flags(cls, int(value)).copy()
         return self
 
     @property
@@ -103,7 +103,7 @@ class ChannelPosition:
             'lock_permissions': self.lock_permissions,
             'parent_id': self.parent_id,
         }
-        return remove_undefined(**payload)
+        return remove_undefined(payload)
 
 
 class Guild:
@@ -38,6 +38,10 @@ if TYPE_CHECKING:
     from .state import State
     from .ui.text_input import Modal
 
+# shared no-embeds sentinel; a tuple can't be mutated by accident the
+# way the old shared-list default could
+_EMPTY_EMBEDS: tuple[Embed, ...] = ()
+
 
 class InteractionOption:
     __slots__ = ('name', 'type', 'value', 'options', 'focused')
@@ -67,11 +71,14 @@ class Interaction:
         'data',
         'guild_id',
         'channel_id',
-        'member',
-        'user',
+        '_raw_member',
+        '_member',
+        '_raw_user',
+        '_user',
         'token',
         'version',
-        'message',
+        '_raw_message',
+        '_message',
         'app_permissions',
         'locale',
         'guild_locale',
@@ -80,8 +87,6 @@ class Interaction:
         'name',
         'application_command_type',
         'resolved',
-        'options',
-        'guild_id',
         'custom_id',
         'component_type',
         'values',
@@ -109,46 +114,78 @@ class Interaction:
         self.channel_id: Snowflake | MissingEnum = (
             Snowflake(_channel_id) if _channel_id is not None else MISSING
         )
-        _member = data.get('member')
-        self.member = (
-            Member(_member, state, guild_id=self.guild_id)
-            if _member is not None
-            else MISSING
-        )
-        _user = data.get('user')
-        if self.member is not MISSING:
-            self.user = self.member.user
-        else:
-            self.user = User(_user, state) if _user is not None else MISSING
+        # most handlers touch at most one of member/user/message, so keep
+        # the raw payloads around and only build the models on first read
+        self._raw_member = data.get('member')
+        self._member: Member | None = None
+        self._raw_user = data.get('user')
+        self._user: User | None = None
         self.token = data['token']
         self.version = data['version']
-        _message = data.get('message')
-        self.message: Message | MissingEnum = (
-            Message(_message, state) if _message is not None else MISSING
-        )
+        self._raw_message = data.get('message')
+        self._message: Message | None = None
         self.app_permissions: str | MissingEnum = data.get('app_permissions', MISSING)
         self.locale: str | MissingEnum = data.get('locale', MISSING)
         self.guild_locale: str | MissingEnum = data.get('guild_locale', MISSING)
         self.options = []
 
-        # app command data
-        if self.type == 2:
-            self.command_id = Snowflake(self.data['id'])
-            self.name = self.data['name']
-            self.application_command_type = self.data['type']
-            self.resolved = self.data.get('resolved')
-            self.options = [
-                InteractionOption(**option) for option in self.data.get('options', [])
-            ]
-            self.guild_id = (
-                Snowflake(data.get('guild_id'))
-                if data.get('guild_id') is not None
-                else MISSING
+        # only application commands and components carry extra data;
+        # pings and modals skip the specialized tail entirely
+        extra_init = self._TYPE_EXTRA_INIT.get(self.type)
+        if extra_init is not None:
+            extra_init(self, data)
+
+    def _init_application_command(self, data: InteractionData) -> None:
+        d = self.data
+        self.command_id = Snowflake(d['id'])
+        self.name = d['name']
+        self.application_command_type = d['type']
+        self.resolved = d.get('resolved')
+        self.options = [InteractionOption(**option) for option in d.get('options', [])]
+
+    def _init_component(self, data: InteractionData) -> None:
+        d = self.data
+        self.custom_id = d['custom_id']
+        self.component_type = d['component_type']
+        self.values = d.get('values', MISSING)
+
+    _TYPE_EXTRA_INIT = {
+        2: _init_application_command,
+        3: _init_component,
+    }
+
+    @property
+    def member(self) -> Member | MissingEnum:
+        member = self._member
+        if member is None:
+            if self._raw_member is None:
+                return MISSING
+            member = self._member = Member(
+                self._raw_member, self._state, guild_id=self.guild_id
             )
-        elif self.type == 3:
-            self.custom_id = self.data['custom_id']
-            self.component_type = self.data['component_type']
-            self.values = self.data.get('values', MISSING)
+        return member
+
+    @property
+    def user(self) -> User | MissingEnum:
+        user = self._user
+        if user is None:
+            member = self.member
+            if member is not MISSING:
+                user = self._user = member.user
+            elif self._raw_user is not None:
+                user = self._user = User(self._raw_user, self._state)
+            else:
+                return MISSING
+        return user
+
+    @property
+    def message(self) -> Message | MissingEnum:
+        message = self._message
+        if message is None:
+            if self._raw_message is None:
+                return MISSING
+            message = self._message = Message(self._raw_message, self._state)
+        return message
 
     @property
     def resp(self) -> InteractionResponse:
@@ -173,40 +210,36 @@ class InteractionResponse:
         self,
         content: str,
         tts: bool = False,
-        embeds: list[Embed] = [],
+        embeds: list[Embed] | None = None,
         flags: int | MessageFlags = 0,
     ) -> None:
         if self.responded:
             raise InteractionException('This interaction has already been responded to')
 
+        if embeds is None:
+            embeds = _EMPTY_EMBEDS
+
         if isinstance(flags, MessageFlags):
             flags = flags.as_bit
 
+        payload = {
+            'type': 4,
+            'data': {
+                'content': content,
+                'tts': tts,
+                'embeds': embeds,
+                'flags': flags,
+            },
+        }
+
         if self._save:
-            self.raw_response = {
-                'type': 4,
-                'data': {
-                    'content': content,
-                    'tts': tts,
-                    'embeds': embeds,
-                    'flags': flags,
-                },
-            }
+            self.raw_response = payload
             self.responded = True
             return
 
-        await self._parent._state.http.create_interaction_response(
-            self._parent.id,
-            self._parent.token,
-            {
-                'type': 4,
-                'data': {
-                    'content': content,
-                    'tts': tts,
-                    'embeds': embeds,
-                    'flags': flags,
-                },
-            },
+        parent = self._parent
+        await parent._state.http.create_interaction_response(
+            parent.id, parent.token, payload
         )
         self.responded = True
 
@@ -237,17 +270,15 @@ class InteractionResponse:
         if self.responded:
             raise InteractionException('This interaction has already been responded to')
 
+        payload = {
+            'type': 8,
+            'data': {'choices': choices},
+        }
+
         if self._save:
-            self.raw_response = {
-                'type': 8,
-                'data': {'choices': choices},
-            }
-
-        await self._state.http.create_interaction_response(
-            self._parent.id,
-            self._parent.token,
-            {
-                'type': 8,
-                'data': {'choices': choices},
-            },
+            self.raw_response = payload
+
+        parent = self._parent
+        await parent._state.http.create_interaction_response(
+            parent.id, parent.token, payload
         )
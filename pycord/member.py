@@ -23,19 +23,22 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from .flags import MemberFlags, Permissions
-from .role import Role
+from .flags import Permissions
 from .snowflake import Snowflake
 
 if TYPE_CHECKING:
+    from .flags import MemberFlags
+    from .role import Role
     from .state import State
+    from .types import GuildMember
 
-from .missing import MISSING, Maybe, MissingEnum
+from .missing import MISSING, MissingEnum
 from .pages import Page
 from .pages.paginator import Paginator
-from .types import GuildMember
 from .user import User
 
+_fromiso = datetime.fromisoformat
+
 
 class Member:
     __slots__ = (
@@ -59,30 +62,37 @@ class Member:
     ) -> None:
         self._state: State = state
         self._guild_id: Snowflake | None = guild_id or None
+        # probe each key once; up to 1000 members are built per
+        # paginator fill, so redundant lookups multiply quickly
+        user = data.get('user')
         self.user: User | MissingEnum = (
-            User(data.get('user'), state) if data.get('user') is not None else MISSING
+            User(user, state) if user is not None else MISSING
         )
         self.nick: str | None | MissingEnum = data.get('nick', MISSING)
         self._avatar: str | None | MissingEnum = data.get('avatar', MISSING)
-        self.roles: list[Snowflake] = [Snowflake(s) for s in data['roles']]
-        self.joined_at: datetime = datetime.fromisoformat(data['joined_at'])
+        self.roles: list[Snowflake] = list(map(Snowflake, data['roles']))
+        self.joined_at: datetime = _fromiso(data['joined_at'])
+        premium_since = data.get('premium_since', MISSING)
         self.premium_since: None | MissingEnum | datetime = (
-            datetime.fromisoformat(data.get('premium_since'))
-            if data.get('premium_since', MISSING) not in [MISSING, None]
-            else data.get('premium_since', MISSING)
+            _fromiso(premium_since)
+            if premium_since is not MISSING and premium_since is not None
+            else premium_since
         )
         self.deaf: bool | MissingEnum = data.get('deaf', MISSING)
         self.mute: bool | MissingEnum = data.get('mute', MISSING)
         self.pending: MissingEnum | bool = data.get('pending', MISSING)
+        permissions = data.get('permissions', MISSING)
         self.permissions: Permissions | MissingEnum = (
-            Permissions.from_value(data.get('permissions'))
-            if data.get('permissions', MISSING) is not MISSING
+            Permissions.from_value(permissions)
+            if permissions is not MISSING
             else MISSING
         )
+        communication_disabled_until = data.get('communication_disabled_until', MISSING)
         self.communication_disabled_until: None | MissingEnum | datetime = (
-            datetime.fromisoformat(data.get('communication_disabled_until'))
-            if data.get('communication_disabled_until', MISSING) not in [MISSING, None]
-            else data.get('communication_disabled_until', MISSING)
+            _fromiso(communication_disabled_until)
+            if communication_disabled_until is not MISSING
+            and communication_disabled_until is not None
+            else communication_disabled_until
         )
 
     async def edit(
@@ -97,12 +107,14 @@ class Member:
         flags: MemberFlags | None | MissingEnum = MISSING,
         reason: str | None = None,
     ) -> Member:
-        communication_disabled_until = (
-            communication_disabled_until.isoformat()
-            if communication_disabled_until
-            else communication_disabled_until
-        )
-        data = await self._state.http.modify_guild_member(
+        if isinstance(communication_disabled_until, datetime):
+            # no point re-sending (or formatting) an unchanged timeout
+            if communication_disabled_until == self.communication_disabled_until:
+                communication_disabled_until = MISSING
+            else:
+                communication_disabled_until = communication_disabled_until.isoformat()
+        http = self._state.http
+        data = await http.modify_guild_member(
             self._guild_id,
             self.user.id,
             nick=nick,
@@ -133,7 +145,7 @@ class Member:
         """
         await self._state.http.add_guild_member_role(
             self._guild_id,
-            self.id,
+            self.user.id,
             role.id,
             reason=reason,
         )
@@ -155,7 +167,7 @@ class Member:
         """
         await self._state.http.remove_guild_member_role(
             self._guild_id,
-            self.id,
+            self.user.id,
             role.id,
             reason=reason,
         )
@@ -170,12 +182,14 @@ class Member:
         """
         await self._state.http.remove_guild_member(
             self._guild_id,
-            self.id,
+            self.user.id,
             reason=reason,
         )
 
 
 class MemberPage(Page[Member]):
+    __slots__ = ('value',)
+
     def __init__(self, member: Member) -> None:
         self.value = member
 
@@ -200,25 +214,29 @@ class MemberPaginator(Paginator[MemberPage]):
         self.done = False
 
     async def fill(self):
-        if self._previous_page is None or self._previous_page[0] >= len(self._pages):
+        pp = self._previous_page
+        if pp is None or pp[0] >= len(self._pages):
             if self.done:
                 raise StopAsyncIteration
             limit = min(self.limit, 1000) if self.limit else 1000
             if self.limit is not None:
                 self.limit -= limit
-            data = await self._state.http.list_guild_members(
-                self.guild_id,
+            state = self._state
+            guild_id = self.guild_id
+            data = await state.http.list_guild_members(
+                guild_id,
                 limit=limit,
                 after=self.last_id,
             )
-            if len(data) < limit or self.limit <= 0:
+            if len(data) < limit or (self.limit is not None and self.limit <= 0):
                 self.done = True
             if not data:
                 raise StopAsyncIteration
+            # bind the loop invariants once; a full fill wraps up to
+            # 1000 members
+            add = self.add_page
             for member in data:
-                self.add_page(
-                    MemberPage(Member(member, self._state, guild_id=self.guild_id))
-                )
+                add(MemberPage(Member(member, state, guild_id=guild_id)))
 
     async def forward(self):
         await self.fill()
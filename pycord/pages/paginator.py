@@ -31,6 +31,10 @@ __all__: Sequence[str] = ('Page', 'Paginator')
 class Page(Protocol[T]):
     """The class for all Page Types to subclass."""
 
+    # empty slots here let slotted subclasses actually shed their
+    # __dict__; pages are created one per paginated object
+    __slots__ = ()
+
     value: T
 
     async def interact_forward(self, *args, **kwargs) -> None:
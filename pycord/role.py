@@ -28,24 +28,22 @@ from .snowflake import Snowflake
 
 if TYPE_CHECKING:
     from .state import State
+    from .types import Role as DiscordRole, RoleTags as DiscordRoleTags
 
-from .missing import MISSING, Maybe, MissingEnum
-from .types import Role as DiscordRole, RoleTags as DiscordRoleTags
+from .missing import MISSING, MissingEnum
 
 
 class RoleTags:
     __slots__ = ('bot_id', 'integration_id', 'premium_subscriber')
 
     def __init__(self, data: DiscordRoleTags) -> None:
+        bot_id = data.get('bot_id', MISSING)
         self.bot_id: MissingEnum | Snowflake = (
-            Snowflake(data.get('bot_id'))
-            if data.get('bot_id', MISSING) is not MISSING
-            else MISSING
+            Snowflake(bot_id) if bot_id is not MISSING else MISSING
         )
+        integration_id = data.get('integration_id', MISSING)
         self.integration_id: MissingEnum | Snowflake = (
-            Snowflake(data.get('integration_id'))
-            if data.get('integration_id', MISSING) is not MISSING
-            else MISSING
+            Snowflake(integration_id) if integration_id is not MISSING else MISSING
         )
         self.premium_subscriber: MissingEnum | None = data.get(
             'premium_subscriber', MISSING
@@ -70,20 +68,22 @@ class Role:
     )
 
     def __init__(self, data: DiscordRole, state: State) -> None:
+        # hundreds of roles come through on every GUILD_CREATE; bind the
+        # bound method once instead of re-resolving data.get per field
+        g = data.get
         self._state = state
         self.id: Snowflake = Snowflake(data['id'])
         self.name: str = data['name']
-        self.color: Color = Color(data['color'])
+        self.color: Color = Color.from_int(data['color'])
         self.hoist: bool = data['hoist']
-        self.icon: str | None | MissingEnum = data.get('icon', MISSING)
-        self.unicode_emoji: str | None | MissingEnum = data.get(
-            'unicode_emoji', MISSING
-        )
+        self.icon: str | None | MissingEnum = g('icon', MISSING)
+        self.unicode_emoji: str | None | MissingEnum = g('unicode_emoji', MISSING)
         self.position: int = data['position']
         self.permissions: Permissions = Permissions.from_value(data['permissions'])
         self.managed: bool = data['managed']
         self.mentionable: bool = data['mentionable']
-        self._tags: dict[str, str | None] | MissingEnum = data.get('tags', MISSING)
+        _tags = g('tags', MISSING)
+        self._tags: dict[str, str | None] | MissingEnum = _tags
         self.tags: RoleTags | MissingEnum = (
-            RoleTags(self._tags) if self._tags is not MISSING else MISSING
+            RoleTags(_tags) if _tags is not MISSING else MISSING
         )
@@ -23,11 +23,19 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from .utils import DISCORD_EPOCH
 
 
 class Snowflake(int):
+    def __new__(cls, v: int | str) -> Snowflake:
+        # ids get re-wrapped constantly while models are constructed;
+        # an already-wrapped Snowflake can be returned as-is
+        if type(v) is cls:
+            return v
+        return _intern(int(v))
+
     @property
     def timestamp(self) -> datetime:
         return datetime.fromtimestamp(
@@ -51,4 +59,13 @@ class Snowflake(int):
 
     @classmethod
     def from_datetime(cls, dt: datetime) -> Snowflake:
-        return cls((int(dt.timestamp()) - DISCORD_EPOCH) << 22)
+        return cls((int(dt.timestamp() * 1000) - DISCORD_EPOCH) << 22)
+
+
+# the same ids (roles, guilds, users) are wrapped over and over across
+# models; a bounded LRU intern turns re-wraps into a cache hit and
+# dedupes the objects. int subclasses cannot be weakly referenced, so a
+# weak-valued cache is not an option here.
+@lru_cache(maxsize=65536)
+def _intern(value: int) -> Snowflake:
+    return int.__new__(Snowflake, value)
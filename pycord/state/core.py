@@ -123,6 +123,57 @@ class State:
         self._components_via_custom_id: dict[str, Component] = {}
         self.modals: list[Modal] = []
         self.cache_guild_members: bool = options.get('cache_guild_members', True)
+        # (command type, name) -> command, for O(1) interaction routing
+        self._commands_by_name: dict[tuple[int, str], ApplicationCommand] = {}
+
+    async def _bulk_register_commands(self) -> None:
+        # one PUT per scope replaces the per-command GET/POST/PATCH/DELETE
+        # dance; Discord drops any command missing from the payload
+        # always PUT the global scope: an empty payload is what clears
+        # previously deployed globals when none are registered locally
+        buckets: dict[int | None, list[ApplicationCommand]] = {None: []}
+
+        for command in self.commands:
+            if isinstance(command, ApplicationCommand):
+                buckets.setdefault(command.guild_id, []).append(command)
+
+        for guild_id, commands in buckets.items():
+            payload = [command._registration_payload() for command in commands]
+
+            if guild_id:
+                res = await self.http.bulk_overwrite_guild_commands(
+                    self.user.id, guild_id, payload
+                )
+            else:
+                res = await self.http.bulk_overwrite_global_commands(
+                    self.user.id, payload
+                )
+
+            registered = {(cmd['type'], cmd['name']): cmd for cmd in res}
+
+            for command in commands:
+                data = registered.get((command.type, command.name))
+
+                if data is not None:
+                    command.id = data['id']
+                    command._created = True
+
+    async def _dispatch_application_command(self, event: InteractionCreate) -> None:
+        interaction = event.interaction
+        data = interaction.data
+
+        if not data:
+            return
+
+        name = data.get('name')
+
+        if name is None:
+            return
+
+        command = self._commands_by_name.get((data['type'], name))
+
+        if command is not None:
+            await command._invoke(interaction)
 
     def sent_modal(self, modal: Modal) -> None:
         if modal not in self.modals:
@@ -30,6 +30,13 @@ AUTO_MODERATION_KEYWORD_PRESET_TYPES = Literal[1, 2, 3]
 AUTO_MODERATION_EVENT_TYPES = Literal[1]
 AUTO_MODERATION_ACTION_TYPES = Literal[1, 2, 3]
 
+# runtime counterparts of the Literals above; validators should test
+# membership against these instead of rebuilding a tuple per check
+VALID_AUTO_MODERATION_TRIGGER_TYPES = frozenset((1, 3, 4, 5))
+VALID_AUTO_MODERATION_KEYWORD_PRESET_TYPES = frozenset((1, 2, 3))
+VALID_AUTO_MODERATION_EVENT_TYPES = frozenset((1,))
+VALID_AUTO_MODERATION_ACTION_TYPES = frozenset((1, 2, 3))
+
 
 class AutoModerationActionMetadata(TypedDict):
     channel_id: Snowflake
@@ -44,11 +44,12 @@ class User:
         self.system: bool | MissingEnum = data.get('system', MISSING)
         self.mfa_enabled: bool | MissingEnum = data.get('mfa_enabled', MISSING)
         self._banner: MissingEnum | str | None = data.get('banner', MISSING)
-        self._accent_color: MissingEnum | int | None = data.get('accent_color', MISSING)
+        _accent_color = data.get('accent_color', MISSING)
+        self._accent_color: MissingEnum | int | None = _accent_color
         self.accent_color: MissingEnum | Color | None = (
-            Color(self._accent_color)
-            if self._accent_color not in [MISSING, None]
-            else self._accent_color
+            Color(_accent_color)
+            if _accent_color is not MISSING and _accent_color is not None
+            else _accent_color
         )
         self.locale: MissingEnum | LOCALE = data.get('locale', MISSING)
         self.verified: MissingEnum | bool = data.get('verified', MISSING)
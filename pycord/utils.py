@@ -46,10 +46,15 @@ from .types import AsyncFunc
 
 try:
     import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
 except ImportError:
     import json
 
-    msgspec = None
+    orjson = None
 
 if TYPE_CHECKING:
     from .commands.application import ApplicationCommand
@@ -61,16 +66,35 @@ T = TypeVar('T')
 
 async def _text_or_json(cr: ClientResponse) -> str | dict[str, Any]:
     if cr.content_type == 'application/json':
-        return await cr.json(encoding='utf-8', loads=loads)
+        # hand the raw body to the parser; going through cr.json() would
+        # decode the bytes to str only for loads to re-encode them
+        return loads(await cr.read())
     return await cr.text('utf-8')
 
 
-def loads(data: Any) -> Any:
-    return msgspec.json.decode(data.encode()) if msgspec else json.loads(data)
+# the implementation is picked once at import instead of per call, and
+# msgspec's Decoder/Encoder objects are reused since constructing them
+# on every payload is where msgspec.json.decode/encode lose time. All
+# three accept str and bytes alike, so gateway frames and HTTP bodies
+# both go straight through.
+if msgspec is not None:
+    loads = msgspec.json.Decoder().decode
+    _encode = msgspec.json.Encoder().encode
 
+    def dumps(data: Any) -> str:
+        return _encode(data).decode('utf-8')
 
-def dumps(data: Any) -> str:
-    return msgspec.json.encode(data).decode('utf-8') if msgspec else json.dumps(data)
+elif orjson is not None:
+    loads = orjson.loads
+
+    def dumps(data: Any) -> str:
+        return orjson.dumps(data).decode('utf-8')
+
+else:
+    loads = json.loads
+
+    def dumps(data: Any) -> str:
+        return json.dumps(data)
 
 
 def parse_errors(errors: dict[str, Any], key: str | None = None) -> dict[str, str]:
@@ -115,8 +139,20 @@ def chunk(items: S, n: int) -> Iterator[S]:
         yield items[start:end]  # type: ignore
 
 
-def remove_undefined(**kwargs) -> dict[str, Any]:
-    return {k: v for k, v in kwargs.items() if v is not MISSING}
+# shared result for all-MISSING payloads; must never be mutated
+_EMPTY_PAYLOAD: dict[str, Any] = {}
+
+
+def remove_undefined(
+    data: dict[str, Any] | None = None, /, **kwargs: Any
+) -> dict[str, Any]:
+    # passing the payload dict positionally avoids the kwargs re-pack
+    # CPython does for a ** call on every request
+    if data is not None:
+        kwargs = data
+    if any(v is not MISSING for v in kwargs.values()):
+        return {k: v for k, v in kwargs.items() if v is not MISSING}
+    return _EMPTY_PAYLOAD
 
 
 async def get_iterated_data(iterator: AsyncGenerator) -> list[Any]:
@@ -128,7 +164,10 @@ async def get_iterated_data(iterator: AsyncGenerator) -> list[Any]:
     return hold
 
 
+@functools.lru_cache(maxsize=None)
 def get_arg_defaults(fnc: AsyncFunc) -> dict[str, tuple[Any, Any]]:
+    # signature reflection is expensive and callbacks are hashable;
+    # callers only iterate the result, so sharing the dict is safe
     signature = inspect.signature(fnc)
     ret = {}
     for k, v in signature.parameters.items():